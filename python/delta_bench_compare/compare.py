@@ -6,6 +6,8 @@ import math
 import random
 import statistics
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
 from pathlib import Path
 
 from .formatting import (
@@ -67,18 +69,17 @@ def representative_sample(case: dict, aggregation: str = "median") -> dict | Non
     elapsed_samples = [sample for sample in samples if "elapsed_ms" in sample]
     if not elapsed_samples:
         return None
-    sorted_samples = sorted(
-        elapsed_samples, key=lambda sample: float(sample["elapsed_ms"])
-    )
+    # Convert each timing once and order indices through the C-level list
+    # lookup instead of calling a Python key function per comparison.
+    elapsed = [float(sample["elapsed_ms"]) for sample in elapsed_samples]
     if aggregation == "min":
-        return sorted_samples[0]
+        return elapsed_samples[elapsed.index(min(elapsed))]
+    order = sorted(range(len(elapsed)), key=elapsed.__getitem__)
     if aggregation == "median":
-        return sorted_samples[len(sorted_samples) // 2]
+        return elapsed_samples[order[len(order) // 2]]
     # Nearest-rank p95
-    idx = max(
-        0, min(len(sorted_samples) - 1, math.ceil(0.95 * len(sorted_samples)) - 1)
-    )
-    return sorted_samples[idx]
+    idx = max(0, min(len(order) - 1, math.ceil(0.95 * len(order)) - 1))
+    return elapsed_samples[order[idx]]
 
 
 def representative_ms(case: dict, aggregation: str = "median") -> float | None:
@@ -88,71 +89,71 @@ def representative_ms(case: dict, aggregation: str = "median") -> float | None:
     return float(sample["elapsed_ms"])
 
 
-def _metric_as_int(metrics: dict, key: str) -> int | None:
-    value = metrics.get(key)
-    if value is None:
-        return None
-    return int(value)
+_SCAN_METRIC_KEYS = tuple(
+    field.name for field in fields(SampleMetricSnapshot) if field.name != "contention"
+)
+_CONTENTION_METRIC_KEYS = tuple(
+    field.name for field in fields(ContentionMetricSnapshot)
+)
 
 
-def best_sample_metrics(
-    case: dict, aggregation: str = "median"
-) -> SampleMetricSnapshot | None:
-    sample = representative_sample(case, aggregation=aggregation)
-    if sample is None:
-        return None
+def _metric_ints(metrics: dict, keys: tuple[str, ...]) -> list[int | None]:
+    get = metrics.get
+    return [None if (value := get(key)) is None else int(value) for key in keys]
 
+
+def _sample_metrics(sample: dict) -> SampleMetricSnapshot:
     metrics = sample.get("metrics") or {}
     contention = metrics.get("contention") or {}
     return SampleMetricSnapshot(
-        files_scanned=_metric_as_int(metrics, "files_scanned"),
-        files_pruned=_metric_as_int(metrics, "files_pruned"),
-        bytes_scanned=_metric_as_int(metrics, "bytes_scanned"),
-        scan_time_ms=_metric_as_int(metrics, "scan_time_ms"),
-        rewrite_time_ms=_metric_as_int(metrics, "rewrite_time_ms"),
+        *_metric_ints(metrics, _SCAN_METRIC_KEYS),
         contention=(
             None
             if not contention
             else ContentionMetricSnapshot(
-                worker_count=_metric_as_int(contention, "worker_count"),
-                race_count=_metric_as_int(contention, "race_count"),
-                ops_attempted=_metric_as_int(contention, "ops_attempted"),
-                ops_succeeded=_metric_as_int(contention, "ops_succeeded"),
-                ops_failed=_metric_as_int(contention, "ops_failed"),
-                conflict_append=_metric_as_int(contention, "conflict_append"),
-                conflict_delete_read=_metric_as_int(contention, "conflict_delete_read"),
-                conflict_delete_delete=_metric_as_int(
-                    contention, "conflict_delete_delete"
-                ),
-                conflict_metadata_changed=_metric_as_int(
-                    contention, "conflict_metadata_changed"
-                ),
-                conflict_protocol_changed=_metric_as_int(
-                    contention, "conflict_protocol_changed"
-                ),
-                conflict_transaction=_metric_as_int(contention, "conflict_transaction"),
-                version_already_exists=_metric_as_int(
-                    contention, "version_already_exists"
-                ),
-                max_commit_attempts_exceeded=_metric_as_int(
-                    contention, "max_commit_attempts_exceeded"
-                ),
-                other_errors=_metric_as_int(contention, "other_errors"),
+                *_metric_ints(contention, _CONTENTION_METRIC_KEYS)
             )
         ),
     )
 
 
-def format_change(baseline_ms: float, candidate_ms: float, threshold: float) -> str:
-    status = classify_change(baseline_ms, candidate_ms, threshold)
+def best_sample_metrics(
+    case: dict, aggregation: str = "median"
+) -> SampleMetricSnapshot | None:
+    sample = representative_sample(case, aggregation=aggregation)
+    if sample is None:
+        return None
+    return _sample_metrics(sample)
+
+
+def _summarize_case(
+    case: dict, aggregation: str, include_metrics: bool
+) -> tuple[float | None, SampleMetricSnapshot | None]:
+    sample = representative_sample(case, aggregation=aggregation)
+    if sample is None:
+        return None, None
+    metrics = _sample_metrics(sample) if include_metrics else None
+    return float(sample["elapsed_ms"]), metrics
+
+
+def _format_classified_change(
+    status: str, baseline_ms: float, candidate_ms: float
+) -> str:
     if status == "incomparable":
         return "incomparable"
     if status == "no_change":
         return "no change"
-    ratio = baseline_ms / candidate_ms
     if status == "improvement":
-        return f"{ratio:.2f}x faster"
-    return f"{1 / ratio:.2f}x slower"
+        return f"{baseline_ms / candidate_ms:.2f}x faster"
+    return f"{candidate_ms / baseline_ms:.2f}x slower"
+
+
+def format_change(baseline_ms: float, candidate_ms: float, threshold: float) -> str:
+    return _format_classified_change(
+        classify_change(baseline_ms, candidate_ms, threshold),
+        baseline_ms,
+        candidate_ms,
+    )
 
 
 def _case_run_summaries(case: dict) -> list[dict]:
@@ -253,7 +254,6 @@ def _display_change_for_status(
     *,
     baseline_ms: float | None,
     candidate_ms: float | None,
-    threshold: float,
     mode: str,
 ) -> str:
     if mode == "exploratory" and status in {"improvement", "regression", "no_change"}:
@@ -261,7 +261,7 @@ def _display_change_for_status(
             raise ValueError(
                 "exploratory comparable statuses require baseline and candidate timings"
             )
-        return format_change(baseline_ms, candidate_ms, threshold)
+        return _format_classified_change(status, baseline_ms, candidate_ms)
     if status == "no_change":
         return "no change"
     return status
@@ -313,31 +313,24 @@ def _invalid_perf_change(
     return "invalid: " + " | ".join(details)
 
 
-def _update_summary_counts(
-    row: ComparisonRow,
-    *,
-    faster: int,
-    slower: int,
-    no_change: int,
-    incomparable: int,
-    new: int,
-    removed: int,
-) -> tuple[int, int, int, int, int, int]:
+_SUMMARY_BUCKET_BY_STATUS = {
+    "improvement": "faster",
+    "regression": "slower",
+    "no_change": "no_change",
+    "incomparable": "incomparable",
+    "expected_failure": "incomparable",
+    "inconclusive": "incomparable",
+    "new": "new",
+    "removed": "removed",
+}
+
+
+def _count_row(row: ComparisonRow, counts: dict[str, int]) -> None:
     if _is_out_of_scope_micro_only_row(row):
-        return faster, slower, no_change, incomparable, new, removed
-    if row.status == "improvement":
-        faster += 1
-    elif row.status == "regression":
-        slower += 1
-    elif row.status == "no_change":
-        no_change += 1
-    elif row.status in {"incomparable", "expected_failure", "inconclusive"}:
-        incomparable += 1
-    elif row.status == "new":
-        new += 1
-    elif row.status == "removed":
-        removed += 1
-    return faster, slower, no_change, incomparable, new, removed
+        return
+    bucket = _SUMMARY_BUCKET_BY_STATUS.get(row.status)
+    if bucket is not None:
+        counts[bucket] += 1
 
 
 def _is_out_of_scope_micro_only_row(row: ComparisonRow) -> bool:
@@ -356,6 +349,8 @@ def compare_runs(
     spread_metric: str | None = None,
     sub_ms_threshold_ms: float | None = None,
     sub_ms_policy: str | None = None,
+    *,
+    include_metrics: bool = True,
 ) -> Comparison:
     if mode not in VALID_COMPARE_MODES:
         raise ValueError(
@@ -380,87 +375,78 @@ def compare_runs(
 
     ensure_matching_contexts(baseline, candidate)
 
-    baseline_cases = {c["case"]: c for c in baseline.get("cases", [])}
-    candidate_cases = {c["case"]: c for c in candidate.get("cases", [])}
+    case_pairs: dict[str, list[dict | None]] = {}
+    for case in baseline.get("cases", []):
+        case_pairs.setdefault(case["case"], [None, None])[0] = case
+    for case in candidate.get("cases", []):
+        case_pairs.setdefault(case["case"], [None, None])[1] = case
     invalid_cases = invalid_perf_case_names((baseline, candidate))
     if invalid_cases and mode == "decision":
         raise ValueError(
             "compare requires perf_status=trusted inputs; invalid cases present: "
             + ", ".join(invalid_cases)
         )
-    names = sorted(set(baseline_cases) | set(candidate_cases))
 
     rows: list[ComparisonRow] = []
-    faster = slower = no_change = incomparable = new = removed = 0
+    counts = dict.fromkeys(
+        ("faster", "slower", "no_change", "incomparable", "new", "removed"), 0
+    )
 
-    for name in names:
-        b = baseline_cases.get(name)
-        c = candidate_cases.get(name)
+    for name in sorted(case_pairs):
+        b, c = case_pairs[name]
         baseline_classification = case_classification(b)
         candidate_classification = case_classification(c)
+        base_ms, baseline_metrics = (
+            _summarize_case(b, aggregation, include_metrics)
+            if b is not None
+            else (None, None)
+        )
+        cand_ms, candidate_metrics = (
+            _summarize_case(c, aggregation, include_metrics)
+            if c is not None
+            else (None, None)
+        )
+        baseline_spread_ms = _spread_ms(b, spread_metric) if b is not None else None
+        candidate_spread_ms = _spread_ms(c, spread_metric) if c is not None else None
 
         if b is None and c is not None:
             row = ComparisonRow(
                 case=name,
                 baseline_ms=None,
-                candidate_ms=representative_ms(c, aggregation=aggregation),
+                candidate_ms=cand_ms,
                 status="new",
                 change="new",
                 baseline_classification=baseline_classification,
                 candidate_classification=candidate_classification,
                 spread_metric=spread_metric,
-                candidate_spread_ms=_spread_ms(c, spread_metric),
+                candidate_spread_ms=candidate_spread_ms,
                 baseline_metrics=None,
-                candidate_metrics=best_sample_metrics(c, aggregation=aggregation),
+                candidate_metrics=candidate_metrics,
             )
             rows.append(row)
-            faster, slower, no_change, incomparable, new, removed = (
-                _update_summary_counts(
-                    row,
-                    faster=faster,
-                    slower=slower,
-                    no_change=no_change,
-                    incomparable=incomparable,
-                    new=new,
-                    removed=removed,
-                )
-            )
+            _count_row(row, counts)
             continue
         if c is None and b is not None:
             row = ComparisonRow(
                 case=name,
-                baseline_ms=representative_ms(b, aggregation=aggregation),
+                baseline_ms=base_ms,
                 candidate_ms=None,
                 status="removed",
                 change="removed",
                 baseline_classification=baseline_classification,
                 candidate_classification=candidate_classification,
                 spread_metric=spread_metric,
-                baseline_spread_ms=_spread_ms(b, spread_metric),
-                baseline_metrics=best_sample_metrics(b, aggregation=aggregation),
+                baseline_spread_ms=baseline_spread_ms,
+                baseline_metrics=baseline_metrics,
                 candidate_metrics=None,
             )
             rows.append(row)
-            faster, slower, no_change, incomparable, new, removed = (
-                _update_summary_counts(
-                    row,
-                    faster=faster,
-                    slower=slower,
-                    no_change=no_change,
-                    incomparable=incomparable,
-                    new=new,
-                    removed=removed,
-                )
-            )
+            _count_row(row, counts)
             continue
 
         if b is None or c is None:
             raise ValueError(f"inconsistent comparison state for case '{name}'")
 
-        base_ms = representative_ms(b, aggregation=aggregation)
-        cand_ms = representative_ms(c, aggregation=aggregation)
-        baseline_spread_ms = _spread_ms(b, spread_metric)
-        candidate_spread_ms = _spread_ms(c, spread_metric)
         decision_scope, scope_reason = _decision_scope(
             mode=mode,
             baseline_ms=base_ms,
@@ -487,21 +473,11 @@ def compare_runs(
                 spread_metric=spread_metric,
                 baseline_spread_ms=baseline_spread_ms,
                 candidate_spread_ms=candidate_spread_ms,
-                baseline_metrics=best_sample_metrics(b, aggregation=aggregation),
-                candidate_metrics=best_sample_metrics(c, aggregation=aggregation),
+                baseline_metrics=baseline_metrics,
+                candidate_metrics=candidate_metrics,
             )
             rows.append(row)
-            faster, slower, no_change, incomparable, new, removed = (
-                _update_summary_counts(
-                    row,
-                    faster=faster,
-                    slower=slower,
-                    no_change=no_change,
-                    incomparable=incomparable,
-                    new=new,
-                    removed=removed,
-                )
-            )
+            _count_row(row, counts)
             continue
         if (
             baseline_classification == "expected_failure"
@@ -520,21 +496,11 @@ def compare_runs(
                 spread_metric=spread_metric,
                 baseline_spread_ms=baseline_spread_ms,
                 candidate_spread_ms=candidate_spread_ms,
-                baseline_metrics=best_sample_metrics(b, aggregation=aggregation),
-                candidate_metrics=best_sample_metrics(c, aggregation=aggregation),
+                baseline_metrics=baseline_metrics,
+                candidate_metrics=candidate_metrics,
             )
             rows.append(row)
-            faster, slower, no_change, incomparable, new, removed = (
-                _update_summary_counts(
-                    row,
-                    faster=faster,
-                    slower=slower,
-                    no_change=no_change,
-                    incomparable=incomparable,
-                    new=new,
-                    removed=removed,
-                )
-            )
+            _count_row(row, counts)
             continue
 
         if mode == "decision":
@@ -573,7 +539,6 @@ def compare_runs(
                     status,
                     baseline_ms=base_ms,
                     candidate_ms=cand_ms,
-                    threshold=threshold,
                     mode=mode,
                 ),
                 baseline_classification=baseline_classification,
@@ -587,17 +552,7 @@ def compare_runs(
                 candidate_metrics=None,
             )
             rows.append(row)
-            faster, slower, no_change, incomparable, new, removed = (
-                _update_summary_counts(
-                    row,
-                    faster=faster,
-                    slower=slower,
-                    no_change=no_change,
-                    incomparable=incomparable,
-                    new=new,
-                    removed=removed,
-                )
-            )
+            _count_row(row, counts)
             continue
 
         if base_ms is None or cand_ms is None:
@@ -614,21 +569,11 @@ def compare_runs(
                 spread_metric=spread_metric,
                 baseline_spread_ms=baseline_spread_ms,
                 candidate_spread_ms=candidate_spread_ms,
-                baseline_metrics=best_sample_metrics(b, aggregation=aggregation),
-                candidate_metrics=best_sample_metrics(c, aggregation=aggregation),
+                baseline_metrics=baseline_metrics,
+                candidate_metrics=candidate_metrics,
             )
             rows.append(row)
-            faster, slower, no_change, incomparable, new, removed = (
-                _update_summary_counts(
-                    row,
-                    faster=faster,
-                    slower=slower,
-                    no_change=no_change,
-                    incomparable=incomparable,
-                    new=new,
-                    removed=removed,
-                )
-            )
+            _count_row(row, counts)
             continue
 
         status = classify_change(base_ms, cand_ms, threshold)
@@ -641,7 +586,6 @@ def compare_runs(
                 status,
                 baseline_ms=base_ms,
                 candidate_ms=cand_ms,
-                threshold=threshold,
                 mode=mode,
             ),
             baseline_classification=baseline_classification,
@@ -651,33 +595,48 @@ def compare_runs(
             spread_metric=spread_metric,
             baseline_spread_ms=baseline_spread_ms,
             candidate_spread_ms=candidate_spread_ms,
-            baseline_metrics=best_sample_metrics(b, aggregation=aggregation),
-            candidate_metrics=best_sample_metrics(c, aggregation=aggregation),
+            baseline_metrics=baseline_metrics,
+            candidate_metrics=candidate_metrics,
         )
         rows.append(row)
-        faster, slower, no_change, incomparable, new, removed = _update_summary_counts(
-            row,
-            faster=faster,
-            slower=slower,
-            no_change=no_change,
-            incomparable=incomparable,
-            new=new,
-            removed=removed,
+        _count_row(row, counts)
+
+    return Comparison(rows=rows, summary=Summary(**counts))
+
+
+def _drop_sample_metrics(payload: dict) -> None:
+    for case in payload.get("cases", []):
+        for sample in case.get("samples") or []:
+            if isinstance(sample, dict):
+                sample.pop("metrics", None)
+
+
+def _load(path: Path, *, include_metrics: bool = True) -> dict:
+    payload = load_benchmark_payload(path)
+    if not include_metrics:
+        # Per-sample metrics are only rendered with --include-metrics; release
+        # them right after parsing so large payloads do not keep them resident.
+        _drop_sample_metrics(payload)
+    return payload
+
+
+def _load_pair(
+    baseline_path: Path, candidate_path: Path, *, include_metrics: bool = True
+) -> tuple[dict, dict]:
+    if baseline_path.resolve() == candidate_path.resolve():
+        # compare_runs never mutates its inputs, so a self-comparison can share
+        # one parsed payload.
+        payload = _load(baseline_path, include_metrics=include_metrics)
+        return payload, payload
+    # The two payloads are independent, so overlap their read and parse work.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        baseline_future = executor.submit(
+            _load, baseline_path, include_metrics=include_metrics
         )
-
-    summary = Summary(
-        faster=faster,
-        slower=slower,
-        no_change=no_change,
-        incomparable=incomparable,
-        new=new,
-        removed=removed,
-    )
-    return Comparison(rows=rows, summary=summary)
-
-
-def _load(path: Path) -> dict:
-    return load_benchmark_payload(path)
+        candidate_future = executor.submit(
+            _load, candidate_path, include_metrics=include_metrics
+        )
+        return baseline_future.result(), candidate_future.result()
 
 
 def render_text(comparison: Comparison, include_metrics: bool = False) -> str:
@@ -809,15 +768,19 @@ def main() -> None:
 
     try:
         fail_on_statuses = _parse_fail_on(args.fail_on)
+        baseline, candidate = _load_pair(
+            baseline_path, candidate_path, include_metrics=args.include_metrics
+        )
         comparison = compare_runs(
-            _load(baseline_path),
-            _load(candidate_path),
+            baseline,
+            candidate,
             threshold=args.noise_threshold,
             aggregation=args.aggregation,
             mode=args.mode,
             spread_metric=args.spread_metric,
             sub_ms_threshold_ms=args.sub_ms_threshold_ms,
             sub_ms_policy=args.sub_ms_policy,
+            include_metrics=args.include_metrics,
         )
     except (ValueError, OSError) as exc:
         print(str(exc), file=sys.stderr)
@@ -839,7 +802,7 @@ def main() -> None:
         output = render_markdown(comparison, include_metrics=args.include_metrics)
     else:
         output = render_text(comparison, include_metrics=args.include_metrics)
-    print(output)
+    sys.stdout.write(output + "\n")
     if any(_matches_fail_on(row, fail_on_statuses) for row in comparison.rows):
         raise SystemExit(2)
 
@@ -60,6 +60,34 @@ _CONTENTION_METRIC_HEADERS = [
 ]
 
 
+_BASE_HEADERS = ("Case", "baseline", "candidate", "delta_pct", "change")
+
+
+def _header_for_flags(scan_metrics: bool, contention_metrics: bool) -> tuple[str, ...]:
+    header = _BASE_HEADERS
+    if scan_metrics:
+        header += tuple(_SCAN_METRIC_HEADERS)
+    if contention_metrics:
+        header += tuple(_CONTENTION_METRIC_HEADERS)
+    return header
+
+
+# Keyed by (scan_metrics, contention_metrics) column flags.
+_HEADERS_BY_FLAGS = {
+    (scan, contention): _header_for_flags(scan, contention)
+    for scan in (False, True)
+    for contention in (False, True)
+}
+_DISPLAY_HEADERS_BY_FLAGS = {
+    flags: tuple(_DISPLAY_HEADERS.get(h, h) for h in header)
+    for flags, header in _HEADERS_BY_FLAGS.items()
+}
+_MARKDOWN_HEADER_LINES_BY_FLAGS = {
+    flags: (" | ".join(header), " | ".join(["---"] * len(header)))
+    for flags, header in _HEADERS_BY_FLAGS.items()
+}
+
+
 def _fmt_ms(value: float | None) -> str:
     return "-" if value is None else f"{value:.2f} ms"
 
@@ -106,23 +134,16 @@ def _has_contention_metrics(rows: list[ComparisonRow]) -> bool:
     return False
 
 
-def _headers(rows: list[ComparisonRow], include_metrics: bool = False) -> list[str]:
-    header = ["Case", "baseline", "candidate", "delta_pct", "change"]
-    if include_metrics:
-        if _has_scan_metrics(rows):
-            header.extend(_SCAN_METRIC_HEADERS)
-        if _has_contention_metrics(rows):
-            header.extend(_CONTENTION_METRIC_HEADERS)
-    return header
+def _metric_column_flags(
+    rows: list[ComparisonRow], include_metrics: bool
+) -> tuple[bool, bool]:
+    if not include_metrics:
+        return False, False
+    return _has_scan_metrics(rows), _has_contention_metrics(rows)
 
 
-def _display_headers(
-    rows: list[ComparisonRow], include_metrics: bool = False
-) -> list[str]:
-    return [
-        _DISPLAY_HEADERS.get(h, h)
-        for h in _headers(rows, include_metrics=include_metrics)
-    ]
+def _headers(rows: list[ComparisonRow], include_metrics: bool = False) -> list[str]:
+    return list(_HEADERS_BY_FLAGS[_metric_column_flags(rows, include_metrics)])
 
 
 def _contention_values(metrics: object | None) -> list[str]:
@@ -156,6 +177,12 @@ def _interleave_metric_cells(
 
 def _row_cells(
     row: ComparisonRow, rows: list[ComparisonRow], include_metrics: bool = False
+) -> list[str]:
+    return _cells_for_row(row, *_metric_column_flags(rows, include_metrics))
+
+
+def _cells_for_row(
+    row: ComparisonRow, scan_metrics: bool, contention_metrics: bool
 ) -> list[str]:
     cells = [
         row.case,
@@ -164,10 +191,10 @@ def _row_cells(
         _fmt_delta_pct(row.baseline_ms, row.candidate_ms, row.status),
         row.change,
     ]
-    if include_metrics:
+    if scan_metrics or contention_metrics:
         baseline_metrics = row.baseline_metrics
         candidate_metrics = row.candidate_metrics
-        if _has_scan_metrics(rows):
+        if scan_metrics:
             cells.extend(
                 [
                     _fmt_metric(
@@ -202,7 +229,7 @@ def _row_cells(
                     ),
                 ]
             )
-        if _has_contention_metrics(rows):
+        if contention_metrics:
             cells.extend(
                 _interleave_metric_cells(
                     _contention_values(baseline_metrics),
@@ -251,11 +278,11 @@ def _table_lines_markdown(
     rows: list[ComparisonRow],
     include_metrics: bool = False,
 ) -> list[str]:
-    header = _headers(reference_rows, include_metrics=include_metrics)
-    lines = [" | ".join(header), " | ".join(["---"] * len(header))]
-    for row in rows:
-        cells = _row_cells(row, reference_rows, include_metrics=include_metrics)
-        lines.append(" | ".join(cells))
+    # Metric column presence depends on every reference row, so resolve it once
+    # per table rather than once per rendered row.
+    flags = _metric_column_flags(reference_rows, include_metrics)
+    lines = list(_MARKDOWN_HEADER_LINES_BY_FLAGS[flags])
+    lines.extend(" | ".join(_cells_for_row(row, *flags)) for row in rows)
     return lines
 
 
@@ -272,10 +299,9 @@ def _table_lines_plain(
     rows: list[ComparisonRow],
     include_metrics: bool = False,
 ) -> list[str]:
-    header = _display_headers(reference_rows, include_metrics=include_metrics)
-    raw_body = [
-        _row_cells(row, reference_rows, include_metrics=include_metrics) for row in rows
-    ]
+    flags = _metric_column_flags(reference_rows, include_metrics)
+    header = _DISPLAY_HEADERS_BY_FLAGS[flags]
+    raw_body = [_cells_for_row(row, *flags) for row in rows]
 
     # Compute widths from raw (uncolored) values
     widths = [len(column) for column in header]
@@ -17,7 +17,7 @@ VALID_COMPARISON_STATUSES = frozenset(
 COMPARABLE_COMPARISON_STATUSES = frozenset({"improvement", "regression", "no_change"})
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SampleMetricSnapshot:
     files_scanned: int | None
     files_pruned: int | None
@@ -27,7 +27,7 @@ class SampleMetricSnapshot:
     contention: "ContentionMetricSnapshot | None" = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContentionMetricSnapshot:
     worker_count: int | None
     race_count: int | None
@@ -45,7 +45,7 @@ class ContentionMetricSnapshot:
     other_errors: int | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComparisonRow:
     case: str
     baseline_ms: float | None
@@ -95,7 +95,7 @@ class ComparisonRow:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Summary:
     faster: int
     slower: int
@@ -115,7 +115,7 @@ class Summary:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Comparison:
     rows: list[ComparisonRow]
     summary: Summary
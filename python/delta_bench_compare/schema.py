@@ -1,7 +1,17 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
+import stat
+import sys
 from pathlib import Path
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional parse accelerator
+    orjson = None  # type: ignore[assignment]
 
 VALID_CLASSIFICATIONS = {"supported", "expected_failure"}
 VALID_PERF_STATUSES = {"trusted", "validation_only", "invalid"}
@@ -151,9 +161,43 @@ def ensure_matching_contexts(baseline: dict, candidate: dict) -> None:
         )
 
 
+def read_json_file(path: Path) -> Any:
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    with path.open("rb") as fh:
+        mapped = _map_regular_file(fh)
+        if mapped is None:
+            return _orjson_loads(fh.read())
+        # Parse straight from the page cache instead of copying the file into
+        # an intermediate bytes object first.
+        with mapped, memoryview(mapped) as view:
+            return _orjson_loads(view)
+
+
+def _orjson_loads(data: bytes | memoryview) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # json.dumps writes NaN/Infinity tokens by default and the stdlib
+        # parser has always accepted them; orjson does not.
+        return json.loads(bytes(data))
+
+
+def _map_regular_file(fh: BinaryIO) -> mmap.mmap | None:
+    # Pipes, FIFOs and process substitution (<(...)) cannot be mapped, and
+    # neither can empty files; callers read those the ordinary way.
+    st = os.fstat(fh.fileno())
+    if not stat.S_ISREG(st.st_mode) or st.st_size <= 0:
+        return None
+    try:
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
 def load_benchmark_payload(path: Path) -> dict:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = read_json_file(path)
     except json.JSONDecodeError as exc:
         raise ValueError(f"{path}: invalid JSON ({exc.msg})") from exc
     if payload.get("schema_version") != 5:
@@ -182,6 +226,10 @@ def load_benchmark_payload(path: Path) -> dict:
         if case_name in seen_case_names:
             raise ValueError(f"{path}: duplicate case id '{case_name}' in cases array")
         seen_case_names.add(case_name)
-        case_classification(case)
+        # Case ids key several per-comparison maps and classifications repeat on
+        # every case; interning lets those lookups and equality checks hit the
+        # identity fast path.
+        case["case"] = sys.intern(case_name)
+        case["classification"] = sys.intern(case_classification(case))
         case_perf_status(case)
     return payload
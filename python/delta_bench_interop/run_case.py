@@ -5,48 +5,58 @@ import argparse
 import hashlib
 import json
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional JSON accelerator
+    orjson = None  # type: ignore[assignment]
 
-def _load_rows(
-    fixtures_dir: Path, scale: str, limit: int = 5000
-) -> list[dict[str, Any]]:
+
+@dataclass(frozen=True, slots=True)
+class FixtureRows:
+    rows: list[dict[str, Any]]
+    n_bytes: int
+
+
+def _load_rows(fixtures_dir: Path, scale: str, limit: int = 5000) -> FixtureRows:
     path = fixtures_dir / scale / "narrow_sales" / "rows.jsonl"
+    loads = json.loads if orjson is None else orjson.loads
     rows: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as fh:
+    n_bytes = 0
+    with path.open("rb") as fh:
         for line in fh:
-            if not line.strip():
+            n_bytes += len(line)
+            if line.isspace():
                 continue
-            rows.append(json.loads(line))
+            rows.append(loads(line))
             if len(rows) >= limit:
                 break
-    return rows
-
-
-def _approx_bytes(rows: list[dict[str, Any]]) -> int:
-    if not rows:
-        return 0
-    return len(rows) * 48
+    return FixtureRows(rows=rows, n_bytes=n_bytes)
 
 
 def _hash_payload(value: Any) -> str:
+    # Result hashes are pinned in the manifests, so always hash the stdlib
+    # encoding: orjson spells some floats differently (1e16 vs 1e+16).
     encoded = json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
     return f"sha256:{hashlib.sha256(encoded).hexdigest()}"
 
 
 def _expected_failure(
-    rows: list[dict[str, Any]], message: str, elapsed_ms: float | None = None
+    fixture: FixtureRows, message: str, elapsed_ms: float | None = None
 ) -> dict[str, Any]:
+    rows = fixture.rows
     digest = _hash_payload({"message": message, "rows": len(rows)})
     return {
         "rows_processed": len(rows),
-        "bytes_processed": _approx_bytes(rows),
+        "bytes_processed": fixture.n_bytes,
         "operations": 1,
         "table_version": None,
         "peak_rss_mb": None,
         "cpu_time_ms": None,
-        "bytes_read": _approx_bytes(rows),
+        "bytes_read": fixture.n_bytes,
         "bytes_written": 0,
         "files_touched": None,
         "files_skipped": None,
@@ -59,37 +69,36 @@ def _expected_failure(
         "classification": "expected_failure",
     }
 
-def _pandas_case(rows: list[dict[str, Any]]) -> dict[str, Any]:
+def _pandas_case(fixture: FixtureRows) -> dict[str, Any]:
     try:
         import pandas as pd
     except ImportError as exc:
-        return _expected_failure(rows, f"missing dependency: {exc}", elapsed_ms=0.0)
+        return _expected_failure(fixture, f"missing dependency: {exc}", elapsed_ms=0.0)
 
-    started = time.perf_counter()
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame(fixture.rows)
     started = time.perf_counter()
     grouped = (
         df[df["flag"]]
-        .groupby("region", as_index=False)["value_i64"]
+        .groupby("region", as_index=False, sort=True, observed=True)["value_i64"]
         .sum()
-        .sort_values("region")
     )
     elapsed_ms = (time.perf_counter() - started) * 1000.0
+    digest = _hash_payload(grouped.to_dict(orient="records"))
     payload = {
         "rows_processed": int(df.shape[0]),
-        "bytes_processed": _approx_bytes(rows),
+        "bytes_processed": fixture.n_bytes,
         "operations": 1,
         "table_version": None,
         "peak_rss_mb": None,
         "cpu_time_ms": None,
-        "bytes_read": _approx_bytes(rows),
+        "bytes_read": fixture.n_bytes,
         "bytes_written": 0,
         "files_touched": None,
         "files_skipped": None,
         "spill_bytes": 0,
-        "result_hash": _hash_payload(grouped.to_dict(orient="records")),
+        "result_hash": digest,
         "schema_hash": _hash_payload(["region:string", "value_i64:int"]),
-        "semantic_state_digest": _hash_payload(grouped.to_dict(orient="records")),
+        "semantic_state_digest": digest,
         "validation_summary": f"rows_processed={int(df.shape[0])};result_rows={len(grouped)}",
         "elapsed_ms": elapsed_ms,
         "classification": "supported",
@@ -97,97 +106,93 @@ def _pandas_case(rows: list[dict[str, Any]]) -> dict[str, Any]:
     return payload
 
 
-def _polars_case(rows: list[dict[str, Any]]) -> dict[str, Any]:
+def _polars_case(fixture: FixtureRows) -> dict[str, Any]:
     try:
         import polars as pl
     except ImportError as exc:
-        return _expected_failure(rows, f"missing dependency: {exc}", elapsed_ms=0.0)
+        return _expected_failure(fixture, f"missing dependency: {exc}", elapsed_ms=0.0)
 
-    started = time.perf_counter()
-    frame = pl.DataFrame(rows)
+    frame = pl.DataFrame(fixture.rows)
     started = time.perf_counter()
     grouped = (
-        frame.filter(pl.col("flag") == True)
+        frame.lazy()
+        .filter(pl.col("flag"))
         .group_by("region")
         .agg(pl.col("value_i64").sum().alias("value_i64_sum"))
         .sort("region")
+        .collect()
     )
     elapsed_ms = (time.perf_counter() - started) * 1000.0
+    digest = _hash_payload(grouped.to_dicts())
     return {
         "rows_processed": int(frame.height),
-        "bytes_processed": _approx_bytes(rows),
+        "bytes_processed": fixture.n_bytes,
         "operations": 1,
         "table_version": None,
         "peak_rss_mb": None,
         "cpu_time_ms": None,
-        "bytes_read": _approx_bytes(rows),
+        "bytes_read": fixture.n_bytes,
         "bytes_written": 0,
         "files_touched": None,
         "files_skipped": None,
         "spill_bytes": 0,
-        "result_hash": _hash_payload(grouped.to_dicts()),
+        "result_hash": digest,
         "schema_hash": _hash_payload(["region:string", "value_i64_sum:int"]),
-        "semantic_state_digest": _hash_payload(grouped.to_dicts()),
+        "semantic_state_digest": digest,
         "validation_summary": f"rows_processed={int(frame.height)};result_rows={grouped.height}",
         "elapsed_ms": elapsed_ms,
         "classification": "supported",
     }
 
 
-def _pyarrow_case(rows: list[dict[str, Any]]) -> dict[str, Any]:
+def _pyarrow_case(fixture: FixtureRows) -> dict[str, Any]:
     try:
         import pyarrow as pa
         import pyarrow.compute as pc
     except ImportError as exc:
-        return _expected_failure(rows, f"missing dependency: {exc}", elapsed_ms=0.0)
+        return _expected_failure(fixture, f"missing dependency: {exc}", elapsed_ms=0.0)
 
-    started = time.perf_counter()
-    table = pa.table(
-        {
-            "id": [row["id"] for row in rows],
-            "flag": [row["flag"] for row in rows],
-            "value_i64": [row["value_i64"] for row in rows],
-        }
+    schema = pa.schema(
+        [("id", pa.int64()), ("flag", pa.bool_()), ("value_i64", pa.int64())]
     )
+    table = pa.Table.from_pylist(fixture.rows, schema=schema)
     started = time.perf_counter()
-    mask = pc.and_(
-        pc.equal(table["flag"], pa.scalar(True)),
-        pc.greater(table["value_i64"], pa.scalar(0)),
-    )
-    filtered = table.filter(mask)
-    result_value = int(pc.sum(filtered["value_i64"]).as_py() or 0)
+    values = table["value_i64"]
+    mask = pc.and_kleene(table["flag"], pc.greater(values, pa.scalar(0)))
+    filtered = pc.filter(values, mask)
+    result_value = int(pc.sum(filtered).as_py() or 0)
     elapsed_ms = (time.perf_counter() - started) * 1000.0
+    result_rows = len(filtered)
+    digest = _hash_payload({"sum": result_value, "rows": result_rows})
 
     return {
         "rows_processed": int(table.num_rows),
-        "bytes_processed": _approx_bytes(rows),
+        "bytes_processed": fixture.n_bytes,
         "operations": 1,
         "table_version": None,
         "peak_rss_mb": None,
         "cpu_time_ms": None,
-        "bytes_read": _approx_bytes(rows),
+        "bytes_read": fixture.n_bytes,
         "bytes_written": 0,
         "files_touched": None,
         "files_skipped": None,
         "spill_bytes": 0,
-        "result_hash": _hash_payload({"sum": result_value, "rows": filtered.num_rows}),
+        "result_hash": digest,
         "schema_hash": _hash_payload(["sum:int", "rows:int"]),
-        "semantic_state_digest": _hash_payload(
-            {"sum": result_value, "rows": filtered.num_rows}
-        ),
-        "validation_summary": f"rows_processed={int(table.num_rows)};result_rows={filtered.num_rows}",
+        "semantic_state_digest": digest,
+        "validation_summary": f"rows_processed={int(table.num_rows)};result_rows={result_rows}",
         "elapsed_ms": elapsed_ms,
         "classification": "supported",
     }
 
 
-def _run_case(case: str, rows: list[dict[str, Any]]) -> dict[str, Any]:
+def _run_case(case: str, fixture: FixtureRows) -> dict[str, Any]:
     if case == "pandas_roundtrip_smoke":
-        return _pandas_case(rows)
+        return _pandas_case(fixture)
     if case == "polars_roundtrip_smoke":
-        return _polars_case(rows)
+        return _polars_case(fixture)
     if case == "pyarrow_dataset_scan_perf":
-        return _pyarrow_case(rows)
+        return _pyarrow_case(fixture)
     raise ValueError(f"unknown case: {case}")
 
 
@@ -198,12 +203,15 @@ def main() -> None:
     parser.add_argument("--scale", required=True)
     args = parser.parse_args()
 
-    rows = _load_rows(Path(args.fixtures_dir), args.scale)
-    if not rows:
+    fixture = _load_rows(Path(args.fixtures_dir), args.scale)
+    if not fixture.rows:
         raise SystemExit("no rows loaded from fixture set")
 
-    result = _run_case(args.case, rows)
-    print(json.dumps(result, separators=(",", ":")))
+    result = _run_case(args.case, fixture)
+    if orjson is None:
+        print(json.dumps(result, separators=(",", ":")))
+    else:
+        print(orjson.dumps(result).decode("utf-8"))
 
 
 if __name__ == "__main__":
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+import concurrent.futures
+import functools
+import hashlib
 import json
 import os
 import shutil
+import stat
 import subprocess
 import tempfile
+import threading
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Sequence
+from typing import IO, Callable, Sequence
+
+from delta_bench_compare.schema import read_json_file
+
+from .matrix_runner import _system_load_per_cpu, _wait_for_load_guard
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional JSON accelerator
+    orjson = None  # type: ignore[assignment]
+
+# Every temporary checkout is named "checkout", and git derives the worktree
+# admin directory name from it, so concurrent add/remove calls must not race.
+_WORKTREE_LOCK = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -20,6 +39,7 @@ class ArtifactBuildMetadata:
     status: str
     artifact_path: str | None
     error: str | None
+    content_hash: str | None = None
 
 
 def artifact_binary_path(artifacts_dir: Path | str, revision: str) -> Path:
@@ -35,14 +55,37 @@ def artifact_metadata_path(artifacts_dir: Path | str, revision: str) -> Path:
 def write_artifact_metadata(path: Path | str, metadata: ArtifactBuildMetadata) -> None:
     destination = Path(path)
     destination.parent.mkdir(parents=True, exist_ok=True)
-    destination.write_text(
-        json.dumps(asdict(metadata), indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
+    if orjson is None:
+        payload = (
+            json.dumps(asdict(metadata), indent=2, sort_keys=True) + "\n"
+        ).encode("utf-8")
+    else:
+        payload = orjson.dumps(
+            asdict(metadata),
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_APPEND_NEWLINE,
+        )
+    # should_skip_build trusts this file, so never leave a partial write behind.
+    fd, temp_name = tempfile.mkstemp(
+        dir=destination.parent,
+        prefix=f".{destination.name}.",
+        suffix=".tmp",
     )
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        temp_path.replace(destination)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
 
 
 def load_artifact_metadata(path: Path | str) -> ArtifactBuildMetadata:
-    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    payload = read_json_file(Path(path))
     return ArtifactBuildMetadata(**payload)
 
 
@@ -53,30 +96,42 @@ def should_skip_build(artifacts_dir: Path | str, revision: str) -> bool:
     metadata = load_artifact_metadata(metadata_file)
     if metadata.status != "success" or not metadata.artifact_path:
         return False
-    return is_trusted_artifact_path(
+    if not is_trusted_artifact_path(
         artifacts_dir=artifacts_dir,
         revision=revision,
         artifact_path=metadata.artifact_path,
+    ):
+        return False
+    # Metadata written before content hashes existed is trusted as before.
+    if metadata.content_hash is None:
+        return True
+    return metadata.content_hash == artifact_content_hash(
+        revision, metadata.artifact_path
     )
 
 
+def artifact_content_hash(revision: str, artifact_path: Path | str) -> str:
+    st = os.stat(artifact_path)
+    identity = f"{revision}\0{st.st_size}\0{st.st_mtime_ns}"
+    return f"sha256:{hashlib.sha256(identity.encode('utf-8')).hexdigest()}"
+
+
 def is_trusted_artifact_path(
     *,
     artifacts_dir: Path | str,
     revision: str,
     artifact_path: str | Path,
 ) -> bool:
-    expected = artifact_binary_path(artifacts_dir, revision).resolve()
-    candidate = Path(artifact_path)
+    expected = os.path.realpath(artifact_binary_path(artifacts_dir, revision))
     try:
-        candidate_resolved = candidate.resolve(strict=True)
+        candidate_stat = os.lstat(artifact_path)
     except OSError:
         return False
-    if candidate_resolved != expected:
+    if stat.S_ISLNK(candidate_stat.st_mode):
         return False
-    if candidate.is_symlink():
+    if os.path.realpath(artifact_path) != expected:
         return False
-    return candidate.is_file()
+    return stat.S_ISREG(candidate_stat.st_mode)
 
 
 def build_artifact_from_checkout(
@@ -95,14 +150,8 @@ def build_artifact_from_checkout(
         build_command or ["cargo", "build", "-p", "delta-bench", "--release"]
     )
 
-    proc = subprocess.run(
-        command,
-        cwd=checkout,
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-    if proc.returncode != 0:
+    returncode, error_tail = _run_capture_tail(command, cwd=checkout)
+    if returncode != 0:
         metadata = ArtifactBuildMetadata(
             revision=revision,
             commit_timestamp=commit_timestamp,
@@ -110,7 +159,7 @@ def build_artifact_from_checkout(
             rust_toolchain=rust_toolchain,
             status="failure",
             artifact_path=None,
-            error=_truncate_err(proc.stderr or proc.stdout),
+            error=_truncate_err(error_tail),
         )
         write_artifact_metadata(metadata_file, metadata)
         return metadata
@@ -142,6 +191,7 @@ def build_artifact_from_checkout(
         status="success",
         artifact_path=str(output_binary),
         error=None,
+        content_hash=artifact_content_hash(revision, output_binary),
     )
     write_artifact_metadata(metadata_file, metadata)
     return metadata
@@ -155,6 +205,7 @@ def build_revision_artifact(
     artifacts_dir: Path | str,
     build_command: Sequence[str] | None = None,
     sync_harness: bool = True,
+    sparse_paths: Sequence[str] | None = None,
 ) -> ArtifactBuildMetadata:
     if should_skip_build(artifacts_dir, revision):
         return load_artifact_metadata(artifact_metadata_path(artifacts_dir, revision))
@@ -170,19 +221,23 @@ def build_revision_artifact(
     with tempfile.TemporaryDirectory(prefix="delta-bench-build-") as td:
         checkout = Path(td) / "checkout"
         try:
-            _run(
-                [
-                    "git",
-                    "-C",
-                    str(repo),
-                    "worktree",
-                    "add",
-                    "--detach",
-                    str(checkout),
-                    revision,
-                ]
-            )
+            with _WORKTREE_LOCK:
+                _run(
+                    [
+                        "git",
+                        "-C",
+                        str(repo),
+                        "worktree",
+                        "add",
+                        *(["--no-checkout"] if sparse_paths else []),
+                        "--detach",
+                        str(checkout),
+                        revision,
+                    ]
+                )
             worktree_added = True
+            if sparse_paths:
+                _checkout_sparse(checkout, sparse_paths)
             if sync_harness:
                 _sync_harness_to_checkout(checkout)
             toolchain = detect_rust_toolchain(checkout)
@@ -199,17 +254,18 @@ def build_revision_artifact(
         finally:
             if worktree_added:
                 try:
-                    _run(
-                        [
-                            "git",
-                            "-C",
-                            str(repo),
-                            "worktree",
-                            "remove",
-                            "--force",
-                            str(checkout),
-                        ]
-                    )
+                    with _WORKTREE_LOCK:
+                        _run(
+                            [
+                                "git",
+                                "-C",
+                                str(repo),
+                                "worktree",
+                                "remove",
+                                "--force",
+                                str(checkout),
+                            ]
+                        )
                 except Exception as cleanup_exc:  # noqa: BLE001 - capture cleanup errors too
                     cleanup_message = f"worktree cleanup failed: {cleanup_exc}"
                     build_error = (
@@ -247,6 +303,76 @@ def build_revision_artifact(
     return build_result
 
 
+def build_revision_artifacts(
+    *,
+    repository: Path | str,
+    revisions: Sequence[tuple[str, str]],
+    artifacts_dir: Path | str,
+    max_workers: int = 1,
+    build_command: Sequence[str] | None = None,
+    sync_harness: bool = True,
+    sparse_paths: Sequence[str] | None = None,
+    build_fn: Callable[..., ArtifactBuildMetadata] | None = None,
+    max_load_per_cpu: float | None = None,
+    load_check_interval_seconds: float = 5.0,
+    load_provider: Callable[[], float | None] | None = None,
+    sleep_fn: Callable[[float], None] | None = None,
+) -> list[ArtifactBuildMetadata]:
+    # A custom build_fn replaces build_revision_artifact and receives only
+    # repository, revision, commit_timestamp and artifacts_dir.
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    if max_load_per_cpu is not None and max_load_per_cpu <= 0:
+        raise ValueError("max_load_per_cpu must be > 0 when configured")
+    if load_check_interval_seconds <= 0:
+        raise ValueError("load_check_interval_seconds must be > 0")
+    build = build_fn or functools.partial(
+        build_revision_artifact,
+        build_command=build_command,
+        sync_harness=sync_harness,
+        sparse_paths=sparse_paths,
+    )
+    get_load = load_provider or _system_load_per_cpu
+    sleep = sleep_fn or time.sleep
+
+    def build_one(entry: tuple[str, str]) -> ArtifactBuildMetadata:
+        revision, commit_timestamp = entry
+        return build(
+            repository=repository,
+            revision=revision,
+            commit_timestamp=commit_timestamp,
+            artifacts_dir=artifacts_dir,
+        )
+
+    def wait_for_load() -> None:
+        _wait_for_load_guard(
+            max_load_per_cpu, load_check_interval_seconds, get_load, sleep
+        )
+
+    if max_workers == 1 or len(revisions) <= 1:
+        results: list[ArtifactBuildMetadata] = []
+        for entry in revisions:
+            wait_for_load()
+            results.append(build_one(entry))
+        return results
+    # Each build runs in its own worktree and spends its time in git/cargo
+    # child processes, so threads are enough to overlap them. Builds are
+    # submitted one slot at a time so the load guard gates every start.
+    futures: list[concurrent.futures.Future[ArtifactBuildMetadata]] = []
+    in_flight: set[concurrent.futures.Future[ArtifactBuildMetadata]] = set()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for entry in revisions:
+            if len(in_flight) >= max_workers:
+                _, in_flight = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+            wait_for_load()
+            future = pool.submit(build_one, entry)
+            futures.append(future)
+            in_flight.add(future)
+    return [future.result() for future in futures]
+
+
 def detect_rust_toolchain(checkout_dir: Path | str) -> str:
     proc = subprocess.run(
         ["rustup", "show", "active-toolchain"],
@@ -262,12 +388,60 @@ def detect_rust_toolchain(checkout_dir: Path | str) -> str:
 
 
 def _run(command: Sequence[str]) -> None:
-    proc = subprocess.run(command, check=False, capture_output=True, text=True)
-    if proc.returncode != 0:
-        detail = _truncate_err(proc.stderr or proc.stdout)
+    returncode, error_tail = _run_capture_tail(command)
+    if returncode != 0:
+        detail = _truncate_err(error_tail)
         raise RuntimeError(f"command failed: {' '.join(command)}: {detail}")
 
 
+def _checkout_sparse(checkout: Path, sparse_paths: Sequence[str]) -> None:
+    # Cone mode always keeps top-level files (Cargo.toml, Cargo.lock), so only
+    # the directories the build needs have to be listed.
+    _run(
+        [
+            "git",
+            "-C",
+            str(checkout),
+            "sparse-checkout",
+            "set",
+            "--cone",
+            *sparse_paths,
+        ]
+    )
+    _run(["git", "-C", str(checkout), "checkout", "--detach", "HEAD"])
+
+
+def _run_capture_tail(
+    command: Sequence[str],
+    *,
+    cwd: Path | None = None,
+    env: dict[str, str] | None = None,
+    tail_bytes: int = 16 * 1024,
+) -> tuple[int, str]:
+    # Release builds can log megabytes; only the tail is ever reported, so
+    # spool each stream to disk and read back a bounded window. stderr stays
+    # separate and is preferred, so compiler errors are not crowded out of the
+    # window by interleaved progress output.
+    with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+        returncode = subprocess.run(
+            list(command),
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=stdout,
+            stderr=stderr,
+            check=False,
+        ).returncode
+        error_tail = _read_tail(stderr, tail_bytes) or _read_tail(stdout, tail_bytes)
+    return returncode, error_tail
+
+
+def _read_tail(handle: IO[bytes], limit: int) -> str:
+    size = handle.seek(0, os.SEEK_END)
+    handle.seek(max(0, size - limit))
+    return handle.read().decode("utf-8", errors="replace")
+
+
 def _sync_harness_to_checkout(checkout_dir: Path) -> None:
     repo_root = Path(__file__).resolve().parents[2]
     sync_script = repo_root / "scripts" / "sync_harness_to_delta_rs.sh"
@@ -275,21 +449,24 @@ def _sync_harness_to_checkout(checkout_dir: Path) -> None:
         return
     env = os.environ.copy()
     env["DELTA_RS_DIR"] = str(checkout_dir)
-    proc = subprocess.run(
-        [str(sync_script)],
-        cwd=repo_root,
-        env=env,
-        check=False,
-        capture_output=True,
-        text=True,
+    returncode, error_tail = _run_capture_tail(
+        [str(sync_script)], cwd=repo_root, env=env
     )
-    if proc.returncode != 0:
-        detail = _truncate_err(proc.stderr or proc.stdout)
+    if returncode != 0:
+        detail = _truncate_err(error_tail)
         raise RuntimeError(f"harness sync failed: {detail}")
 
 
+_ASCII_REVISION_TABLE = str.maketrans(
+    {chr(code): "_" for code in range(128) if not chr(code).isalnum()}
+)
+
+
 def _sanitize_revision(revision: str) -> str:
-    safe = "".join(ch if ch.isalnum() else "_" for ch in revision).strip("_")
+    if revision.isascii():
+        safe = revision.translate(_ASCII_REVISION_TABLE).strip("_")
+    else:
+        safe = "".join(ch if ch.isalnum() else "_" for ch in revision).strip("_")
     if not safe:
         raise ValueError("revision must contain at least one alphanumeric character")
     return safe
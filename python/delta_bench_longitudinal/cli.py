@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 from dataclasses import asdict, is_dataclass
 from pathlib import Path
-from typing import Any, Callable, Iterable, Union
+from typing import Any, Callable, Iterable, Iterator, Union
 
 from .artifacts import (
     ArtifactBuildMetadata,
     artifact_metadata_path,
-    build_revision_artifact,
+    build_revision_artifacts,
     is_trusted_artifact_path,
     load_artifact_metadata,
 )
@@ -23,8 +25,13 @@ from .matrix_runner import (
 )
 from .retention import prune_artifacts, prune_store
 from .reporting import generate_trend_reports
-from .revisions import load_manifest, select_revisions, write_manifest
-from .store import ingest_benchmark_result
+from .revisions import (
+    RevisionEntry,
+    load_manifest,
+    select_revisions,
+    write_manifest,
+)
+from .store import ingest_benchmark_results
 
 
 BuildFn = Callable[..., Union[ArtifactBuildMetadata, dict[str, Any]]]
@@ -54,27 +61,36 @@ def orchestrate_from_manifest(
     build_fn: BuildFn | None = None,
     matrix_executor=None,
     label_prefix: str = "longitudinal",
+    max_parallel_builds: int = 1,
 ) -> dict[str, int]:
     manifest = load_manifest(manifest_path)
-    chosen_build = build_fn or build_revision_artifact
-    build_results: list[ArtifactBuildMetadata] = []
-
-    for revision in manifest.revisions:
-        raw_meta = chosen_build(
-            repository=manifest.repository,
-            revision=revision.commit,
-            commit_timestamp=revision.commit_timestamp,
-            artifacts_dir=artifacts_dir,
-        )
-        build_results.append(_coerce_metadata(raw_meta))
+    revision_to_ts = _revision_timestamps(manifest.revisions)
+
+    build_results = build_revision_artifacts(
+        repository=manifest.repository,
+        revisions=[
+            (revision.commit, revision.commit_timestamp)
+            for revision in manifest.revisions
+        ],
+        artifacts_dir=artifacts_dir,
+        max_workers=max_parallel_builds,
+        build_fn=(
+            functools.partial(_build_and_coerce, build_fn)
+            if build_fn is not None
+            else None
+        ),
+        max_load_per_cpu=max_load_per_cpu,
+        load_check_interval_seconds=load_check_interval_seconds,
+    )
 
-    expected_revisions = {entry.commit for entry in manifest.revisions}
     artifacts: list[MatrixArtifact] = []
     for meta in build_results:
         if meta.status != "success" or not meta.artifact_path:
             continue
-        if meta.revision not in expected_revisions:
+        if meta.revision not in revision_to_ts:
             continue
+        # Checked on every run and never memoized: the binary can be swapped
+        # between builds, and the build function may be a caller's own.
         if not is_trusted_artifact_path(
             artifacts_dir=artifacts_dir,
             revision=meta.revision,
@@ -107,9 +123,6 @@ def orchestrate_from_manifest(
         executor=matrix_executor,
     )
 
-    revision_to_ts = {
-        entry.commit: entry.commit_timestamp for entry in manifest.revisions
-    }
     ingested_rows = _ingest_from_state(
         matrix_state=matrix_state,
         results_dir=Path(results_dir),
@@ -144,9 +157,10 @@ def _ingest_from_state(
     label_prefix: str,
     revision_to_ts: dict[str, str],
 ) -> int:
-    total = 0
+    entries: list[tuple[Path, str, str]] = []
     config = matrix_state.get("config", {})
     configured_lane = str(config.get("lane") or "")
+    available = _index_result_files(results_dir)
     for case in matrix_state.get("cases", {}).values():
         if case.get("status") != "success":
             continue
@@ -154,33 +168,64 @@ def _ingest_from_state(
         suite = str(case.get("suite"))
         scale = str(case.get("scale"))
         lane = str(case.get("lane") or configured_lane)
-        candidate_labels: list[str] = []
-        if lane:
-            candidate_labels.append(
-                matrix_result_label(label_prefix, revision, scale, lane)
-            )
-        candidate_labels.extend(
-            [
-                matrix_result_label(label_prefix, revision, scale),
-                sanitize_label(f"{label_prefix}-{revision}"),
-            ]
+        result_file = f"{suite}.json"
+        label = _find_result_label(
+            available,
+            result_file,
+            _candidate_result_labels(label_prefix, revision, scale, lane),
         )
-        result_path: Path | None = None
-        for label in candidate_labels:
-            candidate = results_dir / label / f"{suite}.json"
-            if candidate.exists():
-                result_path = candidate
-                break
-        if result_path is None:
+        if label is None:
             continue
-        outcome = ingest_benchmark_result(
-            store_dir=store_dir,
-            result_path=result_path,
-            revision=revision,
-            commit_timestamp=revision_to_ts.get(revision, "unknown"),
+        entries.append(
+            (
+                results_dir / label / result_file,
+                revision,
+                revision_to_ts.get(revision, "unknown"),
+            )
         )
-        total += int(outcome["rows_appended"])
-    return total
+    outcome = ingest_benchmark_results(store_dir=store_dir, entries=entries)
+    return int(outcome["rows_appended"])
+
+
+def _candidate_result_labels(
+    label_prefix: str, revision: str, scale: str, lane: str
+) -> Iterator[str]:
+    # Lazily yielded so current lane-scoped results never pay for building the
+    # legacy label spellings.
+    if lane:
+        yield matrix_result_label(label_prefix, revision, scale, lane)
+    yield matrix_result_label(label_prefix, revision, scale)
+    yield sanitize_label(f"{label_prefix}-{revision}")
+
+
+def _find_result_label(
+    available: dict[str, set[str]], result_file: str, labels: Iterable[str]
+) -> str | None:
+    for label in labels:
+        if result_file in available.get(label, ()):
+            return label
+    return None
+
+
+def _index_result_files(results_dir: Path) -> dict[str, set[str]]:
+    available: dict[str, set[str]] = {}
+    # Unreadable or non-directory paths count as "no results", matching the
+    # semantics of a Path.exists() probe.
+    try:
+        label_entries = list(os.scandir(results_dir))
+    except OSError:
+        return available
+    for label_entry in label_entries:
+        if not label_entry.is_dir():
+            continue
+        try:
+            with os.scandir(label_entry.path) as entries:
+                available[label_entry.name] = {
+                    entry.name for entry in entries if entry.name.endswith(".json")
+                }
+        except OSError:
+            continue
+    return available
 
 
 def _coerce_metadata(
@@ -193,14 +238,22 @@ def _coerce_metadata(
     return ArtifactBuildMetadata(**value)
 
 
+def _build_and_coerce(build_fn: BuildFn, **kwargs: Any) -> ArtifactBuildMetadata:
+    return _coerce_metadata(build_fn(**kwargs))
+
+
+def _revision_timestamps(revisions: Iterable[RevisionEntry]) -> dict[str, str]:
+    # Doubles as the expected-revision set: membership checks go through the
+    # same dict instead of a second pass building a separate set.
+    return {entry.commit: entry.commit_timestamp for entry in revisions}
+
+
 def _load_manifest_artifacts(
     manifest_path: Path | str,
     artifacts_dir: Path | str,
 ) -> tuple[list[MatrixArtifact], dict[str, str]]:
     manifest = load_manifest(manifest_path)
-    revision_to_ts = {
-        entry.commit: entry.commit_timestamp for entry in manifest.revisions
-    }
+    revision_to_ts = _revision_timestamps(manifest.revisions)
     artifacts: list[MatrixArtifact] = []
     for entry in manifest.revisions:
         metadata_file = artifact_metadata_path(artifacts_dir, entry.commit)
@@ -227,6 +280,16 @@ def _load_manifest_artifacts(
     return artifacts, revision_to_ts
 
 
+def _positive_int(value: str) -> int:
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if parsed < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1 (got {parsed})")
+    return parsed
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Longitudinal benchmark orchestration")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -245,6 +308,8 @@ def main(argv: list[str] | None = None) -> int:
     )
     build_cmd.add_argument("--manifest", required=True, type=Path)
     build_cmd.add_argument("--artifacts-dir", required=True, type=Path)
+    build_cmd.add_argument("--max-parallel-builds", type=_positive_int, default=1)
+    build_cmd.add_argument("--sparse-path", action="append", default=None)
 
     matrix_cmd = sub.add_parser(
         "run-matrix", help="Run suite/scale matrix for built artifacts"
@@ -321,6 +386,9 @@ def main(argv: list[str] | None = None) -> int:
     orchestration_cmd.add_argument("--timeout-seconds", type=int, default=3600)
     orchestration_cmd.add_argument("--max-retries", type=int, default=2)
     orchestration_cmd.add_argument("--max-parallel", type=int, default=1)
+    orchestration_cmd.add_argument(
+        "--max-parallel-builds", type=_positive_int, default=1
+    )
     orchestration_cmd.add_argument("--max-load-per-cpu", type=float, default=None)
     orchestration_cmd.add_argument(
         "--load-check-interval-seconds", type=float, default=5.0
@@ -355,16 +423,17 @@ def main(argv: list[str] | None = None) -> int:
 
     if args.command == "build-artifacts":
         manifest = load_manifest(args.manifest)
-        built = 0
-        for revision in manifest.revisions:
-            metadata = build_revision_artifact(
-                repository=manifest.repository,
-                revision=revision.commit,
-                commit_timestamp=revision.commit_timestamp,
-                artifacts_dir=args.artifacts_dir,
-            )
-            if metadata.status == "success":
-                built += 1
+        results = build_revision_artifacts(
+            repository=manifest.repository,
+            revisions=[
+                (revision.commit, revision.commit_timestamp)
+                for revision in manifest.revisions
+            ],
+            artifacts_dir=args.artifacts_dir,
+            max_workers=args.max_parallel_builds,
+            sparse_paths=args.sparse_path,
+        )
+        built = sum(1 for metadata in results if metadata.status == "success")
         print(json.dumps({"built": built}, sort_keys=True))
         return 0
 
@@ -393,9 +462,7 @@ def main(argv: list[str] | None = None) -> int:
     if args.command == "ingest-results":
         matrix_state = load_matrix_state(args.state_path)
         manifest = load_manifest(args.manifest)
-        revision_to_ts = {
-            entry.commit: entry.commit_timestamp for entry in manifest.revisions
-        }
+        revision_to_ts = _revision_timestamps(manifest.revisions)
         rows = _ingest_from_state(
             matrix_state=matrix_state,
             results_dir=args.results_dir,
@@ -465,6 +532,7 @@ def main(argv: list[str] | None = None) -> int:
             significance_method=args.significance_method,
             significance_alpha=args.significance_alpha,
             label_prefix=args.label_prefix,
+            max_parallel_builds=args.max_parallel_builds,
         )
         print(json.dumps(summary, sort_keys=True))
         return 0
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
 import concurrent.futures
+import itertools
 import json
 import os
 import re
+import string
 import subprocess
 import tempfile
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Iterable, Optional
+from typing import IO, Callable, Iterable, Optional
+
+from delta_bench_compare.schema import read_json_file
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional JSON accelerator
+    orjson = None  # type: ignore[assignment]
 
 
 SAFE_TOKEN = re.compile(r"^[A-Za-z0-9._-]+$")
+_SAFE_TOKEN_CHARS = frozenset(string.ascii_letters + string.digits + "._-")
+_UNSAFE_LABEL_RUN = re.compile(r"(?:[^A-Za-z0-9._-]|_)+")
 VALID_LANES = {"smoke", "correctness", "macro"}
 
 
@@ -50,7 +61,7 @@ def load_matrix_state(path: Path | str) -> dict:
     if not state_path.exists():
         return {"schema_version": 1, "cases": {}}
     try:
-        state = json.loads(state_path.read_text(encoding="utf-8"))
+        state = read_json_file(state_path)
     except json.JSONDecodeError as exc:
         raise ValueError(f"invalid matrix state at {state_path}: {exc}") from exc
     if not isinstance(state, dict):
@@ -70,22 +81,74 @@ def load_matrix_state(path: Path | str) -> dict:
             raise ValueError(
                 f"invalid matrix state at {state_path}: expected case {key!r} to be an object"
             )
+    journal_path = _matrix_journal_path(state_path)
+    if journal_path.exists():
+        _replay_matrix_journal(journal_path, state.setdefault("cases", cases))
     return state
 
 
+def _matrix_journal_path(state_path: Path) -> Path:
+    return state_path.with_name(state_path.name + ".journal")
+
+
+def _replay_matrix_journal(journal_path: Path, cases: dict) -> None:
+    loads = json.loads if orjson is None else orjson.loads
+    with journal_path.open("rb") as handle:
+        for line in handle:
+            if line.isspace():
+                continue
+            try:
+                entry = loads(line)
+            except ValueError:
+                # A crash mid-append can only tear the final line. ValueError
+                # covers both JSONDecodeError and a UnicodeDecodeError from a
+                # line cut inside a multi-byte sequence.
+                break
+            if (
+                not isinstance(entry, dict)
+                or not isinstance(entry.get("key"), str)
+                or not isinstance(entry.get("case"), dict)
+            ):
+                raise ValueError(
+                    f"invalid matrix state journal at {journal_path}: "
+                    "expected objects with 'key' and 'case'"
+                )
+            cases[entry["key"]] = entry["case"]
+
+
+def _append_matrix_journal(handle: IO[bytes], key: str, case: dict) -> None:
+    entry = {"key": key, "case": case}
+    if orjson is None:
+        line = (json.dumps(entry, sort_keys=True) + "\n").encode("utf-8")
+    else:
+        line = orjson.dumps(
+            entry, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    handle.write(line)
+    handle.flush()
+    os.fsync(handle.fileno())
+
+
 def save_matrix_state(path: Path | str, data: dict) -> None:
     state_path = Path(path)
     state_path.parent.mkdir(parents=True, exist_ok=True)
-    payload = json.dumps(data, indent=2, sort_keys=True) + "\n"
+    if orjson is None:
+        payload = (json.dumps(data, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    else:
+        payload = orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_APPEND_NEWLINE,
+        )
     fd, temp_name = tempfile.mkstemp(
         dir=state_path.parent,
         prefix=f".{state_path.name}.",
         suffix=".tmp",
-        text=True,
     )
     temp_path = Path(temp_name)
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        with os.fdopen(fd, "wb") as handle:
             handle.write(payload)
             handle.flush()
             os.fsync(handle.fileno())
@@ -141,69 +204,109 @@ def run_matrix(
     get_load = load_provider or _system_load_per_cpu
     sleep = sleep_fn or time.sleep
     max_attempts = config.max_retries + 1
-    pending: list[tuple[str, MatrixArtifact, str, str, int]] = []
-
-    for artifact in artifacts:
-        _validate_tokens([artifact.revision], "revision")
-        for suite in config.suites:
-            for scale in config.scales:
-                key = _case_key(artifact.revision, suite, scale)
-                existing = cases.get(key)
-                if existing and existing.get("status") == "success":
-                    continue
-                # Retry budget is per invocation, not lifetime cumulative, so
-                # failed cells are retried from attempt 1 on a new run_matrix call.
-                attempts = 0
-                pending.append((key, artifact, suite, scale, attempts))
+    artifacts = list(artifacts)
+    _validate_tokens([artifact.revision for artifact in artifacts], "revision")
+    done_keys = {
+        key for key, case in cases.items() if case.get("status") == "success"
+    }
+    # Retry budget is per invocation, not lifetime cumulative, so failed cells
+    # are retried from attempt 1 (attempts=0) on a new run_matrix call.
+    pending: list[tuple[str, MatrixArtifact, str, str, int]] = [
+        (key, artifact, suite, scale, 0)
+        for artifact, suite, scale in itertools.product(
+            artifacts, config.suites, config.scales
+        )
+        if (key := _case_key(artifact.revision, suite, scale)) not in done_keys
+    ]
 
     if not pending:
         return state
 
+    # Completed cases are appended to a journal and folded into a full snapshot
+    # every few updates, instead of rewriting the whole state file per case.
+    state_path = Path(config.state_path)
+    journal_path = _matrix_journal_path(state_path)
+    snapshot_every = max(16, config.max_parallel * 4)
+    save_matrix_state(state_path, state)
+    journal_path.unlink(missing_ok=True)
+    updates = 0
+
     in_flight: dict[concurrent.futures.Future, tuple[str, MatrixArtifact, str, str]] = (
         {}
     )
     next_idx = 0
-    with concurrent.futures.ThreadPoolExecutor(max_workers=config.max_parallel) as pool:
-        while next_idx < len(pending) or in_flight:
-            while next_idx < len(pending) and len(in_flight) < config.max_parallel:
-                _wait_for_load_guard(config, get_load, sleep)
-                key, artifact, suite, scale, start_attempts = pending[next_idx]
-                next_idx += 1
-                future = pool.submit(
-                    _execute_case,
-                    artifact,
-                    suite,
-                    scale,
-                    start_attempts,
-                    run_exec,
-                    max_attempts,
-                    config.timeout_seconds,
-                )
-                in_flight[future] = (key, artifact, suite, scale)
-
-            if not in_flight:
-                continue
+    journal = journal_path.open("ab")
+    try:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=config.max_parallel
+        ) as pool:
+            while next_idx < len(pending) or in_flight:
+                if next_idx < len(pending) and len(in_flight) < config.max_parallel:
+                    # One load check per scheduler wake-up: the one-minute load
+                    # average cannot reflect cases submitted moments earlier.
+                    _wait_for_load_guard(
+                        config.max_load_per_cpu,
+                        config.load_check_interval_seconds,
+                        get_load,
+                        sleep,
+                    )
+                while next_idx < len(pending) and len(in_flight) < config.max_parallel:
+                    key, artifact, suite, scale, start_attempts = pending[next_idx]
+                    next_idx += 1
+                    future = pool.submit(
+                        _execute_case,
+                        artifact,
+                        suite,
+                        scale,
+                        start_attempts,
+                        run_exec,
+                        max_attempts,
+                        config.timeout_seconds,
+                    )
+                    in_flight[future] = (key, artifact, suite, scale)
+
+                if not in_flight:
+                    continue
 
-            done = next(concurrent.futures.as_completed(in_flight))
-            key, artifact, suite, scale = in_flight.pop(done)
-            try:
-                status, attempts, failure_reason = done.result()
-            except Exception as exc:  # noqa: BLE001 - persist worker errors
-                status = "failure"
-                attempts = max_attempts
-                failure_reason = f"worker exception: {exc}"
-
-            cases[key] = {
-                "revision": artifact.revision,
-                "suite": suite,
-                "scale": scale,
-                "lane": config.lane,
-                "status": status,
-                "attempts": attempts,
-                "failure_reason": failure_reason,
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-            }
-            save_matrix_state(config.state_path, state)
+                done_set, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for done in done_set:
+                    key, artifact, suite, scale = in_flight.pop(done)
+                    try:
+                        status, attempts, failure_reason = done.result()
+                    except Exception as exc:  # noqa: BLE001 - persist worker errors
+                        status = "failure"
+                        attempts = max_attempts
+                        failure_reason = f"worker exception: {exc}"
+
+                    cases[key] = {
+                        "revision": artifact.revision,
+                        "suite": suite,
+                        "scale": scale,
+                        "lane": config.lane,
+                        "status": status,
+                        "attempts": attempts,
+                        "failure_reason": failure_reason,
+                        "updated_at": datetime.now(timezone.utc).isoformat(),
+                    }
+                    _append_matrix_journal(journal, key, cases[key])
+                    updates += 1
+                    if updates % snapshot_every == 0:
+                        save_matrix_state(state_path, state)
+                        journal.truncate(0)
+    except BaseException:
+        journal.close()
+        try:
+            save_matrix_state(state_path, state)
+        except Exception:  # noqa: BLE001 - keep the original error
+            # Completed cases are still fsynced in the journal, which stays in
+            # place for the next load_matrix_state to replay.
+            pass
+        raise
+    journal.close()
+    save_matrix_state(state_path, state)
+    journal_path.unlink(missing_ok=True)
 
     return state
 
@@ -316,24 +419,33 @@ def _default_executor(
         "--iterations",
         str(config.iterations),
     ]
-    proc = subprocess.run(
-        cmd,
-        check=False,
-        capture_output=True,
-        text=True,
-        timeout=timeout_seconds,
-    )
-    message = (
-        (proc.stderr.strip() or proc.stdout.strip()) if proc.returncode != 0 else ""
-    )
+    # Spool output to anonymous temp files rather than pipes so a chatty run
+    # never grows worker memory; only a failure reads back the tail.
+    with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+        proc = subprocess.run(
+            cmd,
+            check=False,
+            stdout=stdout,
+            stderr=stderr,
+            timeout=timeout_seconds,
+        )
+        if proc.returncode == 0:
+            return 0, ""
+        message = _read_output_tail(stderr) or _read_output_tail(stdout)
     return proc.returncode, message
 
 
+def _read_output_tail(handle: IO[bytes], limit: int = 4096) -> str:
+    size = handle.seek(0, os.SEEK_END)
+    handle.seek(max(0, size - limit))
+    return handle.read().decode("utf-8", errors="replace").strip()
+
+
 def _validate_tokens(values: Iterable[str], field: str) -> None:
     for value in values:
         if value in {"", ".", ".."}:
             raise ValueError(f"{field} '{value}' is not allowed")
-        if not SAFE_TOKEN.fullmatch(value):
+        if not _SAFE_TOKEN_CHARS.issuperset(value):
             raise ValueError(
                 f"{field} '{value}' contains invalid characters; allowed [A-Za-z0-9._-]"
             )
@@ -356,8 +468,7 @@ def matrix_result_label(
 
 
 def sanitize_label(value: str) -> str:
-    out = "".join(ch if SAFE_TOKEN.match(ch) else "_" for ch in value)
-    collapsed = re.sub(r"_+", "_", out)
+    collapsed = _UNSAFE_LABEL_RUN.sub("_", value)
     trimmed = collapsed.strip("_")
     if not trimmed or trimmed in {".", ".."}:
         return "label"
@@ -365,17 +476,18 @@ def sanitize_label(value: str) -> str:
 
 
 def _wait_for_load_guard(
-    config: MatrixRunConfig,
+    max_load_per_cpu: Optional[float],
+    check_interval_seconds: float,
     load_provider: Callable[[], Optional[float]],
     sleep_fn: Callable[[float], None],
 ) -> None:
-    if config.max_load_per_cpu is None:
+    if max_load_per_cpu is None:
         return
     while True:
         current = load_provider()
-        if current is None or current <= config.max_load_per_cpu:
+        if current is None or current <= max_load_per_cpu:
             return
-        sleep_fn(config.load_check_interval_seconds)
+        sleep_fn(check_interval_seconds)
 
 
 def _system_load_per_cpu() -> Optional[float]:
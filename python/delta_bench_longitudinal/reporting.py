@@ -2,11 +2,36 @@ from __future__ import annotations
 
 import html
 import math
+import operator
 import statistics
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Any
-
-from .store import load_longitudinal_rows
+from typing import Any, Iterable, Iterator
+
+from .store import iter_longitudinal_rows
+
+_SQRT2 = math.sqrt(2.0)
+
+# Store rows always carry every column, so one C-level itemgetter replaces a
+# row.get() call per identity field in the grouping loop.
+_series_identity = operator.itemgetter(
+    "runner",
+    "benchmark_mode",
+    "timing_phase",
+    "dataset_id",
+    "dataset_fingerprint",
+    "storage_backend",
+    "backend_profile",
+    "lane",
+    "measurement_kind",
+    "validation_level",
+    "harness_revision",
+    "fixture_recipe_hash",
+    "fidelity_fingerprint",
+    "case_definition_hash",
+    "compatibility_key",
+)
 
 
 def generate_trend_reports(
@@ -51,7 +76,10 @@ def generate_trend_reports(
     regressions: list[dict[str, Any]] = []
     significant_regressions = 0
 
-    for key, series in sorted(grouped.items()):
+    # Sort the unique keys alone rather than (key, rows) pairs; each series is
+    # then looked up by key.
+    for key in sorted(grouped):
+        series = grouped[key]
         ordered = sorted(
             series,
             key=lambda row: (
@@ -60,14 +88,12 @@ def generate_trend_reports(
                 row.get("run_id") or "",
             ),
         )
-        medians = [float(row["median_ms"]) for row in ordered]
+        medians = [row["median_ms"] for row in ordered]
         latest = medians[-1]
         baseline_rows = ordered[-(baseline_window + 1) : -1]
-        baseline_values = [
-            float(row["median_ms"])
-            for row in baseline_rows
-            if row.get("median_ms") is not None
-        ]
+        # _load_grouped_rows only keeps rows with a median, so the baseline
+        # medians are the matching slice of the already-converted points.
+        baseline_values = medians[-(baseline_window + 1) : -1]
         baseline_median = (
             statistics.median(baseline_values) if baseline_values else None
         )
@@ -197,54 +223,45 @@ def _mann_whitney_one_sided_p_value(
     if n1 < 2 or n2 < 2:
         return None
 
-    combined = [(value, 1) for value in latest_samples] + [
-        (value, 0) for value in baseline_samples
-    ]
-    combined.sort(key=lambda item: item[0])
-
+    # Average ranks come straight from the sorted pool: a value's tie group
+    # spans [bisect_left, bisect_right), so no (value, label) pairs or
+    # Python-level group walk are needed.
+    pooled = sorted(latest_samples + baseline_samples)
     rank_sum_latest = 0.0
-    tie_group_sizes: list[int] = []
-    idx = 0
-    while idx < len(combined):
-        start = idx
-        current = combined[idx][0]
-        while idx < len(combined) and combined[idx][0] == current:
-            idx += 1
-        end = idx
-        group_size = end - start
-        tie_group_sizes.append(group_size)
-        avg_rank = (start + 1 + end) / 2.0
-        for j in range(start, end):
-            if combined[j][1] == 1:
-                rank_sum_latest += avg_rank
+    for value in latest_samples:
+        rank_sum_latest += (
+            bisect_left(pooled, value) + 1 + bisect_right(pooled, value)
+        ) / 2.0
 
     u_latest = rank_sum_latest - (n1 * (n1 + 1) / 2.0)
     total = n1 + n2
-    tie_sum = sum(size**3 - size for size in tie_group_sizes)
+    tie_sum = 0
+    # Millisecond timings rarely tie; a set size check is enough to skip the
+    # per-value tie correction, which is zero when every value is distinct.
+    if len(set(pooled)) < total:
+        tie_sum = sum(size**3 - size for size in Counter(pooled).values())
     variance = (n1 * n2 / 12.0) * ((total + 1) - (tie_sum / (total * (total - 1))))
     if variance <= 0:
         return None
 
     mean_u = n1 * n2 / 2.0
     z = (u_latest - mean_u) / math.sqrt(variance)
-    cdf = 0.5 * (1.0 + math.erf(z / math.sqrt(2.0)))
-    p_value = 1.0 - cdf
-    if p_value < 0.0:
-        return 0.0
-    if p_value > 1.0:
-        return 1.0
-    return p_value
+    # Upper-tail normal probability in one call. erfc keeps precision for
+    # large z where 1 - cdf cancels to 0, and its range already lies in [0, 1].
+    return 0.5 * math.erfc(z / _SQRT2)
 
 
 def _load_grouped_rows(
     store_dir: Path,
 ) -> tuple[dict[tuple[str, str, str, str], list[dict[str, Any]]], int]:
-    rows = load_longitudinal_rows(store_dir)
-    if not rows:
-        return {}, 0
-    grouped: dict[tuple[str, str, str, str], list[dict[str, Any]]] = {}
+    grouped: defaultdict[tuple[str, str, str, str], list[dict[str, Any]]] = defaultdict(
+        list
+    )
+    # Most rows share a handful of identities; render each identity tuple to
+    # its series id string once instead of once per row.
+    series_ids: dict[tuple[Any, ...], str] = {}
     invalid_rows = 0
-    for row in rows:
+    for row in iter_longitudinal_rows(store_dir):
         if not row.get("success"):
             invalid_rows += 1
             continue
@@ -254,35 +271,18 @@ def _load_grouped_rows(
         if int(row.get("sample_count") or 0) <= 0:
             invalid_rows += 1
             continue
-        if row.get("median_ms") is None:
+        median = row.get("median_ms")
+        if median is None:
             invalid_rows += 1
             continue
-        series_id = str(
-            (
-                row.get("runner"),
-                row.get("benchmark_mode"),
-                row.get("timing_phase"),
-                row.get("dataset_id"),
-                row.get("dataset_fingerprint"),
-                row.get("storage_backend"),
-                row.get("backend_profile"),
-                row.get("lane"),
-                row.get("measurement_kind"),
-                row.get("validation_level"),
-                row.get("harness_revision"),
-                row.get("fixture_recipe_hash"),
-                row.get("fidelity_fingerprint"),
-                row.get("case_definition_hash"),
-                row.get("compatibility_key"),
-            )
-        )
-        key = (
-            str(row.get("suite", "unknown")),
-            str(row.get("scale", "unknown")),
-            str(row.get("case", "unknown")),
-            series_id,
-        )
-        grouped.setdefault(key, []).append(row)
+        # Convert once here so the per-series points need no float() pass.
+        row["median_ms"] = float(median)
+        identity = _series_identity(row)
+        series_id = series_ids.get(identity)
+        if series_id is None:
+            series_id = series_ids[identity] = str(identity)
+        key = (str(row["suite"]), str(row["scale"]), str(row["case"]), series_id)
+        grouped[key].append(row)
     return grouped, invalid_rows
 
 
@@ -360,28 +360,9 @@ def _html_report(
     significance_method: str,
     significance_alpha: float,
     invalid_rows: int,
-) -> str:
-    cards: list[str] = []
-    for item in series_stats:
-        p_val = item.get("p_value")
-        p_line = ""
-        if significance_method != "none":
-            if p_val is None:
-                p_line = "<p>p-value: n/a</p>"
-            else:
-                p_line = f"<p>p-value: {float(p_val):.6f}</p>"
-        cards.append(
-            (
-                "<section class='card'>"
-                f"<h2>{html.escape(item['suite'])} / {html.escape(item['scale'])} / {html.escape(item['case'])}</h2>"
-                f"<p>Status: <strong>{html.escape(item['status'])}</strong></p>"
-                f"<p>Latest: {item['latest']:.2f} ms</p>"
-                f"{p_line}"
-                f"{_sparkline_svg(item['points'])}"
-                "</section>"
-            )
-        )
-
+) -> Iterator[str]:
+    # Yielded in chunks so _write streams cards to disk instead of joining
+    # every card into one report-sized string first.
     significance_meta = ""
     if significance_method != "none":
         significance_meta = (
@@ -393,7 +374,7 @@ def _html_report(
         f" | Invalid rows skipped: {invalid_rows}" if invalid_rows else ""
     )
 
-    return f"""<!doctype html>
+    yield f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
@@ -419,13 +400,35 @@ def _html_report(
   <h1>Longitudinal Benchmark Trends</h1>
   <p class="meta">Series: {len(series_stats)} | Regressions: {len(regressions)}{significance_meta}{invalid_rows_meta} | Threshold: {regression_threshold:.2%}</p>
   <div class="grid">
-    {"".join(cards)}
+    """
+    for item in series_stats:
+        yield _card_html(item, significance_method=significance_method)
+    yield """
   </div>
 </body>
 </html>
 """
 
 
+def _card_html(item: dict[str, Any], *, significance_method: str) -> str:
+    p_val = item.get("p_value")
+    p_line = ""
+    if significance_method != "none":
+        if p_val is None:
+            p_line = "<p>p-value: n/a</p>"
+        else:
+            p_line = f"<p>p-value: {float(p_val):.6f}</p>"
+    return (
+        "<section class='card'>"
+        f"<h2>{html.escape(item['suite'])} / {html.escape(item['scale'])} / {html.escape(item['case'])}</h2>"
+        f"<p>Status: <strong>{html.escape(item['status'])}</strong></p>"
+        f"<p>Latest: {item['latest']:.2f} ms</p>"
+        f"{p_line}"
+        f"{_sparkline_svg(item['points'])}"
+        "</section>"
+    )
+
+
 def _sparkline_svg(values: list[float]) -> str:
     if not values:
         return "<svg viewBox='0 0 300 90'><text x='4' y='45'>no data</text></svg>"
@@ -437,18 +440,22 @@ def _sparkline_svg(values: list[float]) -> str:
     max_v = max(values)
     value_range = max(max_v - min_v, 1.0)
 
-    points: list[str] = []
-    for idx, value in enumerate(values):
-        x = idx * x_step
-        normalized = (value - min_v) / value_range
-        y = height - (normalized * (height - 10.0)) - 5.0
-        points.append(f"{x:.2f},{y:.2f}")
+    plot_height = height - 10.0
+    # %-formatting a fixed pair is cheaper than two f-string format specs,
+    # and the arithmetic is kept in the original order so output is unchanged.
+    points = " ".join(
+        "%.2f,%.2f"
+        % (idx * x_step, height - ((value - min_v) / value_range) * plot_height - 5.0)
+        for idx, value in enumerate(values)
+    )
 
     return (
         "<svg viewBox='0 0 300 90' role='img' aria-label='trend chart'>"
-        "<polyline fill='none' stroke='#145a8d' stroke-width='2.5' points='{points}' />"
+        "<polyline fill='none' stroke='#145a8d' stroke-width='2.5' points='"
+        + points
+        + "' />"
         "</svg>"
-    ).format(points=" ".join(points))
+    )
 
 
 def _empty_html(invalid_rows: int = 0) -> str:
@@ -463,7 +470,11 @@ def _empty_html(invalid_rows: int = 0) -> str:
 """.format(invalid_rows_html=invalid_rows_html)
 
 
-def _write(path: Path | str, content: str) -> None:
+def _write(path: Path | str, content: str | Iterable[str]) -> None:
     destination = Path(path)
     destination.parent.mkdir(parents=True, exist_ok=True)
-    destination.write_text(content, encoding="utf-8")
+    if isinstance(content, str):
+        destination.write_text(content, encoding="utf-8")
+        return
+    with destination.open("w", encoding="utf-8") as fh:
+        fh.writelines(content)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json
+import functools
+import os
 import shutil
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from delta_bench_compare.schema import read_json_file
+
 from .store import (
     _connect_store,
     _raise_if_unmigrated_legacy_store,
@@ -31,12 +34,13 @@ def prune_artifacts(
         return {"total": 0, "candidates": [], "removed": 0, "applied": apply}
 
     entries: list[tuple[str, datetime, Path]] = []
-    for child in root.iterdir():
-        if not child.is_dir():
-            continue
-        revision = child.name
-        timestamp = _artifact_timestamp(child)
-        entries.append((revision, timestamp, child))
+    # scandir hands back the directory-entry type, so filtering to artifact
+    # directories needs a stat only for symlinks, which are followed.
+    with os.scandir(root) as it:
+        for child in it:
+            if not child.is_dir():
+                continue
+            entries.append((child.name, _artifact_timestamp(child), Path(child.path)))
 
     entries.sort(key=lambda item: item[1], reverse=True)
     candidate_revisions = _select_candidates(
@@ -104,23 +108,23 @@ def prune_store(
                 now=reference,
             )
 
+            removed_runs = 0
             if apply and candidate_runs:
                 with conn:
                     conn.executemany(
                         "DELETE FROM runs WHERE run_id = ?",
                         [(run_id,) for run_id in candidate_runs],
                     )
+                removed_runs = len(candidate_runs)
 
-            remaining_runs = (
-                conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
-                if apply
-                else len(run_timestamps)
-            )
+            # Candidates come from the run ids read under the same lock, so the
+            # remaining count follows without another full-table COUNT(*).
+            remaining_runs = len(run_timestamps) - removed_runs
 
             return {
                 "total_runs": len(run_timestamps),
                 "candidate_runs": candidate_runs,
-                "removed_runs": len(candidate_runs) if apply else 0,
+                "removed_runs": removed_runs,
                 "remaining_runs": remaining_runs,
                 "invalid_rows_skipped": 0,
                 "applied": apply,
@@ -165,14 +169,15 @@ def _select_candidates(
     return sorted(candidates)
 
 
-def _artifact_timestamp(path: Path) -> datetime:
-    metadata_path = path / "metadata.json"
-    if metadata_path.exists():
-        payload = json.loads(metadata_path.read_text(encoding="utf-8"))
-        timestamp = _parse_datetime(payload.get("build_timestamp"))
-        if timestamp is not None:
-            return timestamp
-    return datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+def _artifact_timestamp(entry: os.DirEntry[str]) -> datetime:
+    try:
+        payload = read_json_file(Path(entry.path) / "metadata.json")
+    except FileNotFoundError:
+        payload = {}
+    timestamp = _parse_datetime(payload.get("build_timestamp"))
+    if timestamp is not None:
+        return timestamp
+    return datetime.fromtimestamp(entry.stat().st_mtime, tz=timezone.utc)
 
 
 def _load_run_timestamps(conn: sqlite3.Connection) -> dict[str, datetime]:
@@ -182,21 +187,17 @@ def _load_run_timestamps(conn: sqlite3.Connection) -> dict[str, datetime]:
         FROM runs
         """
     ).fetchall()
-    runs: dict[str, datetime] = {}
-    for run_id, benchmark_created_at, ingested_at in rows:
-        row = {
-            "benchmark_created_at": benchmark_created_at,
-            "ingested_at": ingested_at,
-        }
-        runs[str(run_id)] = _row_timestamp(row)
-    return runs
-
-
-def _row_timestamp(row: dict[str, Any]) -> datetime:
-    timestamp = _parse_datetime(row.get("benchmark_created_at"))
+    return {
+        str(run_id): _run_timestamp(benchmark_created_at, ingested_at)
+        for run_id, benchmark_created_at, ingested_at in rows
+    }
+
+
+def _run_timestamp(benchmark_created_at: Any, ingested_at: Any) -> datetime:
+    timestamp = _parse_datetime(benchmark_created_at)
     if timestamp is not None:
         return timestamp
-    timestamp = _parse_datetime(row.get("ingested_at"))
+    timestamp = _parse_datetime(ingested_at)
     if timestamp is not None:
         return timestamp
     return datetime.fromtimestamp(0, tz=timezone.utc)
@@ -205,6 +206,13 @@ def _row_timestamp(row: dict[str, Any]) -> datetime:
 def _parse_datetime(value: Any) -> datetime | None:
     if not isinstance(value, str) or not value:
         return None
+    return _parse_datetime_text(value)
+
+
+@functools.lru_cache(maxsize=1 << 15)
+def _parse_datetime_text(value: str) -> datetime | None:
+    # datetime is immutable, so cached parses are safe to hand out to every
+    # row or artifact carrying the same stamp.
     try:
         parsed = datetime.fromisoformat(value)
     except ValueError:
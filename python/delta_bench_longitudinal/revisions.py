@@ -3,10 +3,18 @@ from __future__ import annotations
 import json
 import re
 import subprocess
+import tempfile
 from dataclasses import asdict, dataclass
 from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
+
+from delta_bench_compare.schema import read_json_file
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional JSON accelerator
+    orjson = None  # type: ignore[assignment]
 
 
 DEFAULT_RELEASE_TAG_PATTERN = r"^v\d+\.\d+\.\d+([.-].+)?$"
@@ -80,14 +88,24 @@ def write_manifest(manifest: RevisionManifest, path: Path | str) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
     payload = asdict(manifest)
     payload["generated_at"] = manifest.generated_at.isoformat()
-    destination.write_text(
-        json.dumps(payload, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
+    if orjson is None:
+        destination.write_text(
+            json.dumps(payload, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        return
+    destination.write_bytes(
+        orjson.dumps(
+            payload,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_APPEND_NEWLINE,
+        )
     )
 
 
 def load_manifest(path: Path | str) -> RevisionManifest:
-    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    payload = read_json_file(Path(path))
     revisions = [RevisionEntry(**entry) for entry in payload.get("revisions", [])]
     generated_at = datetime.fromisoformat(payload["generated_at"])
     return RevisionManifest(
@@ -106,15 +124,36 @@ def _select_release_tags(
     release_tag_pattern: str,
 ) -> Iterable[RevisionEntry]:
     pattern = re.compile(release_tag_pattern)
-    tags = _git(repo, ["tag", "--list", "--sort=creatordate"]).splitlines()
+    # One for-each-ref call reports every tag with its target and the peeled
+    # commit of annotated tags, instead of rev-list + show per tag.
+    raw = _git(
+        repo,
+        [
+            "for-each-ref",
+            "--sort=creatordate",
+            "--format=%(refname:strip=2)%00%(objecttype)%00%(objectname)"
+            "%00%(committerdate:iso-strict)%00%(*objecttype)%00%(*objectname)"
+            "%00%(*committerdate:iso-strict)",
+            "refs/tags/",
+        ],
+    )
     out: list[RevisionEntry] = []
-    for tag in tags:
-        if not tag or not pattern.match(tag):
+    for line in raw.splitlines():
+        if not line:
+            continue
+        tag, obj_type, obj, obj_ts, peeled_type, peeled, peeled_ts = line.split("\0")
+        if not pattern.match(tag):
             continue
-        commit = _git(repo, ["rev-list", "-n", "1", tag]).strip()
-        commit_ts = _git(
-            repo, ["show", "-s", "--date=iso-strict", "--format=%cI", commit]
-        ).strip()
+        if obj_type == "commit":
+            commit, commit_ts = obj, obj_ts
+        elif peeled_type == "commit":
+            commit, commit_ts = peeled, peeled_ts
+        else:
+            # Tag chains peel more than one level; resolve those the slow way.
+            commit = _git(repo, ["rev-list", "-n", "1", tag]).strip()
+            commit_ts = _git(
+                repo, ["show", "-s", "--date=iso-strict", "--format=%cI", commit]
+            ).strip()
         out.append(
             RevisionEntry(
                 commit=commit,
@@ -166,10 +205,10 @@ def _select_one_per_day(
 
 def _git_commit_rows(
     *, repo: Path, start: date, end: date, ref: str
-) -> list[tuple[str, str]]:
+) -> Iterator[tuple[str, str]]:
     start_ts = f"{start.isoformat()}T00:00:00+00:00"
     end_ts = f"{end.isoformat()}T23:59:59+00:00"
-    raw = _git(
+    lines = _git_stream(
         repo,
         [
             "log",
@@ -184,13 +223,34 @@ def _git_commit_rows(
             end_ts,
         ],
     )
-    rows: list[tuple[str, str]] = []
-    for line in raw.splitlines():
+    for line in lines:
         if not line:
             continue
         commit, commit_ts = line.split("|", 1)
-        rows.append((commit, commit_ts))
-    return rows
+        yield commit, commit_ts
+
+
+def _git_stream(repo: Path, args: list[str]) -> Iterator[str]:
+    # Yields stdout lines as git produces them rather than buffering the whole
+    # history. stderr goes to a temp file so a chatty git cannot block on a
+    # full pipe while we are still draining stdout.
+    command = ["git", "-C", str(repo), *args]
+    with tempfile.TemporaryFile() as stderr, subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=stderr, text=True
+    ) as proc:
+        assert proc.stdout is not None
+        try:
+            for line in proc.stdout:
+                yield line.rstrip("\n")
+        except BaseException:
+            proc.kill()
+            raise
+        if proc.wait() != 0:
+            stderr.seek(0)
+            message = (
+                stderr.read().decode("utf-8", "replace").strip() or "unknown git error"
+            )
+            raise ValueError(f"git command failed: git {' '.join(args)}: {message}")
 
 
 def _git(repo: Path, args: list[str]) -> str:
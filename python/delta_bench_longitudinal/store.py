@@ -8,7 +8,7 @@ from contextlib import closing, contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import IO
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from delta_bench_compare.schema import load_benchmark_payload
 
@@ -17,6 +17,11 @@ try:
 except ImportError:  # pragma: no cover - non-POSIX platforms
     fcntl = None  # type: ignore[assignment]
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional JSON accelerator
+    orjson = None  # type: ignore[assignment]
+
 
 STORE_SCHEMA_VERSION = 2
 STORE_DB_FILENAME = "store.sqlite3"
@@ -53,7 +58,73 @@ def ingest_benchmark_result(
 ) -> dict[str, Any]:
     store_root = Path(store_dir)
     _raise_if_unmigrated_legacy_store(store_root)
-    source = Path(result_path)
+    run_record, case_rows = _prepare_ingest(
+        source=Path(result_path),
+        revision=revision,
+        commit_timestamp=commit_timestamp,
+    )
+    run_id = run_record["run_id"]
+
+    with store_lock(store_root):
+        with closing(_connect_store(store_root)) as conn:
+            if _run_exists(conn, run_id):
+                return {"run_id": run_id, "rows_appended": 0, "deduped": True}
+            with conn:
+                _insert_run_with_cases(conn, run_record, case_rows)
+
+    return {"run_id": run_id, "rows_appended": len(case_rows), "deduped": False}
+
+
+def ingest_benchmark_results(
+    *,
+    store_dir: Path | str,
+    entries: Iterable[tuple[Path | str, str, str]],
+) -> dict[str, Any]:
+    store_root = Path(store_dir)
+    _raise_if_unmigrated_legacy_store(store_root)
+    prepared = [
+        _prepare_ingest(
+            source=Path(result_path),
+            revision=revision,
+            commit_timestamp=commit_timestamp,
+        )
+        for result_path, revision, commit_timestamp in entries
+    ]
+    # Parse and validate everything up front so a bad payload aborts the batch
+    # before the store is touched; new runs then land in one transaction.
+    if not prepared:
+        return {"runs_appended": 0, "rows_appended": 0, "deduped": 0}
+
+    runs_appended = 0
+    rows_appended = 0
+    deduped = 0
+    with store_lock(store_root):
+        with closing(_connect_store(store_root)) as conn:
+            with conn:
+                seen: set[str] = set()
+                for run_record, case_rows in prepared:
+                    run_id = run_record["run_id"]
+                    if run_id in seen or _run_exists(conn, run_id):
+                        deduped += 1
+                        continue
+                    seen.add(run_id)
+                    _insert_run_with_cases(conn, run_record, case_rows)
+                    runs_appended += 1
+                    rows_appended += len(case_rows)
+
+    return {
+        "runs_appended": runs_appended,
+        "rows_appended": rows_appended,
+        "deduped": deduped,
+    }
+
+
+def _prepare_ingest(
+    *,
+    source: Path,
+    revision: str,
+    commit_timestamp: str,
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
     payload = load_benchmark_payload(source)
     _validate_authoritative_longitudinal_payload(payload, source)
     context = payload.get("context", {})
@@ -79,47 +150,55 @@ def ingest_benchmark_result(
         )
         for case in cases
     ]
+    return run_record, case_rows
 
-    with store_lock(store_root):
-        with closing(_connect_store(store_root)) as conn:
-            if _run_exists(conn, run_id):
-                return {"run_id": run_id, "rows_appended": 0, "deduped": True}
-            with conn:
-                _insert_run(conn, run_record)
-                if case_rows:
-                    conn.executemany(
-                        """
-                        INSERT INTO case_rows (
-                            run_id,
-                            case_name,
-                            perf_status,
-                            compatibility_key,
-                            case_definition_hash,
-                            success,
-                            failure_reason,
-                            sample_count,
-                            sample_values_json,
-                            best_ms,
-                            min_ms,
-                            max_ms,
-                            mean_ms,
-                            median_ms
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        [_case_row_params(run_id=run_id, row=row) for row in case_rows],
-                    )
 
-    return {"run_id": run_id, "rows_appended": len(case_rows), "deduped": False}
+def _insert_run_with_cases(
+    conn: sqlite3.Connection,
+    run_record: dict[str, Any],
+    case_rows: list[dict[str, Any]],
+) -> None:
+    run_id = run_record["run_id"]
+    _insert_run(conn, run_record)
+    if case_rows:
+        conn.executemany(
+            """
+            INSERT INTO case_rows (
+                run_id,
+                case_name,
+                perf_status,
+                compatibility_key,
+                case_definition_hash,
+                success,
+                failure_reason,
+                sample_count,
+                sample_values_json,
+                best_ms,
+                min_ms,
+                max_ms,
+                mean_ms,
+                median_ms
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [_case_row_params(run_id=run_id, row=row) for row in case_rows],
+        )
 
 
 def load_longitudinal_rows(store_dir: Path | str) -> list[dict[str, Any]]:
+    return list(iter_longitudinal_rows(store_dir))
+
+
+def iter_longitudinal_rows(store_dir: Path | str) -> Iterator[dict[str, Any]]:
     store_root = Path(store_dir)
     _raise_if_unmigrated_legacy_store(store_root)
     db_path = store_db_path(store_root)
     if not db_path.exists():
-        return []
+        return
     with closing(_connect_store(store_root)) as conn:
-        rows = conn.execute(
+        # Step the cursor rather than fetchall() so only one decoded row is
+        # alive at a time; callers that need the full list use
+        # load_longitudinal_rows.
+        cursor = conn.execute(
             """
             SELECT
                 r.run_id,
@@ -181,8 +260,10 @@ def load_longitudinal_rows(store_dir: Path | str) -> list[dict[str, Any]]:
                 r.run_id,
                 c.case_name
             """
-        ).fetchall()
-    return [_row_from_db(row) for row in rows if row["case_name"] is not None]
+        )
+        for row in cursor:
+            if row["case_name"] is not None:
+                yield _row_from_db(row)
 
 
 def _normalize_run_record(
@@ -585,7 +666,7 @@ def _case_row_params(*, run_id: str, row: dict[str, Any]) -> tuple[Any, ...]:
         int(bool(row["success"])),
         row["failure_reason"],
         row["sample_count"],
-        json.dumps(row["sample_values_ms"]),
+        _dump_sample_values(row["sample_values_ms"]),
         row["best_ms"],
         row["min_ms"],
         row["max_ms"],
@@ -594,6 +675,27 @@ def _case_row_params(*, run_id: str, row: dict[str, Any]) -> tuple[Any, ...]:
     )
 
 
+def _dump_sample_values(values: list[float]) -> str:
+    if orjson is not None:
+        encoded = orjson.dumps(values)
+        # orjson writes NaN/Infinity as null; samples are plain floats, so a
+        # null means a non-finite value the stdlib encoder must round-trip.
+        if b"null" not in encoded:
+            return encoded.decode("utf-8")
+    return json.dumps(values)
+
+
+def _load_sample_values(encoded: str) -> list[float]:
+    if orjson is not None:
+        try:
+            return orjson.loads(encoded)
+        except orjson.JSONDecodeError:
+            # Rows written by json.dumps may carry NaN/Infinity tokens, which
+            # only the stdlib parser accepts.
+            pass
+    return json.loads(encoded)
+
+
 def _row_from_db(row: sqlite3.Row) -> dict[str, Any]:
     return {
         "schema_version": STORE_SCHEMA_VERSION,
@@ -629,7 +731,7 @@ def _row_from_db(row: sqlite3.Row) -> dict[str, Any]:
         "success": bool(row["success"]),
         "failure_reason": row["failure_reason"],
         "sample_count": row["sample_count"],
-        "sample_values_ms": json.loads(row["sample_values_json"]),
+        "sample_values_ms": _load_sample_values(row["sample_values_json"]),
         "best_ms": row["best_ms"],
         "min_ms": row["min_ms"],
         "max_ms": row["max_ms"],
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import math
 import os
 import subprocess
 import sys
@@ -160,6 +161,14 @@ def test_format_change_thresholds() -> None:
     assert format_change(100.0, 103.0, 0.05) == "no change"
 
 
+def test_format_change_threshold_is_inclusive_relative_delta() -> None:
+    assert format_change(100.0, 105.0, 0.05) == "no change"
+    assert format_change(100.0, 95.0, 0.05) == "no change"
+    assert format_change(100.0, 105.5, 0.05) == "1.05x slower"
+    assert format_change(100.0, 94.5, 0.05) == "1.06x faster"
+    assert format_change(42.0, 42.0, 0.0) == "no change"
+
+
 def test_compare_runs_handles_failures_and_missing_cases() -> None:
     base = _run(
         [
@@ -329,6 +338,85 @@ def test_compare_rows_use_metrics_from_median_sample() -> None:
     assert row.candidate_metrics.files_scanned == 11
 
 
+@pytest.mark.parametrize(
+    ("aggregation", "expected_ms", "expected_files"),
+    [("min", 80.0, 7), ("median", 95.0, 8), ("p95", 100.0, 10)],
+)
+def test_compare_rows_pair_timing_and_metrics_from_same_sample(
+    aggregation: str, expected_ms: float, expected_files: int
+) -> None:
+    samples = [
+        {"elapsed_ms": 100.0, "metrics": {"files_scanned": 10}},
+        {"elapsed_ms": 80.0, "metrics": {"files_scanned": 7}},
+        {"elapsed_ms": 95.0, "metrics": {"files_scanned": 8}},
+    ]
+    base = _run([{"case": "a", "success": True, "samples": samples}])
+    cand = _run([{"case": "a", "success": True, "samples": samples}])
+
+    row = compare_runs(base, cand, aggregation=aggregation).rows[0]
+
+    assert row.baseline_ms == row.candidate_ms == expected_ms
+    assert row.baseline_metrics is not None
+    assert row.baseline_metrics.files_scanned == expected_files
+
+
+def test_compare_runs_skips_metric_snapshots_when_not_requested() -> None:
+    samples = [{"elapsed_ms": 10.0, "metrics": {"files_scanned": 4}}]
+    base = _run(
+        [{"case": "a", "samples": samples}, {"case": "gone", "samples": samples}]
+    )
+    cand = _run(
+        [{"case": "a", "samples": samples}, {"case": "new", "samples": samples}]
+    )
+
+    rows = compare_runs(base, cand, include_metrics=False).rows
+
+    assert [row.case for row in rows] == ["a", "gone", "new"]
+    assert all(row.baseline_metrics is None for row in rows)
+    assert all(row.candidate_metrics is None for row in rows)
+    assert rows[0].baseline_ms == 10.0
+
+
+def test_compare_rows_merge_sides_in_case_name_order() -> None:
+    base = _run(
+        [{"case": name, "samples": [{"elapsed_ms": 10.0}]} for name in ("b", "d", "e")]
+    )
+    cand = _run(
+        [
+            {"case": name, "samples": [{"elapsed_ms": 10.0}]}
+            for name in ("a", "c", "d", "f")
+        ]
+    )
+
+    rows = compare_runs(base, cand).rows
+
+    assert [row.case for row in rows] == ["a", "b", "c", "d", "e", "f"]
+    assert [row.status for row in rows] == [
+        "new",
+        "removed",
+        "new",
+        "no_change",
+        "removed",
+        "new",
+    ]
+
+
+def test_compare_rows_break_representative_ties_by_sample_order() -> None:
+    samples = [
+        {"elapsed_ms": 50, "metrics": {"files_scanned": 1}},
+        {"elapsed_ms": 10.0, "metrics": {"files_scanned": 2}},
+        {"elapsed_ms": 10, "metrics": {"files_scanned": 3}},
+        {"metrics": {"files_scanned": 4}},
+    ]
+    payload = _run([{"case": "a", "success": True, "samples": samples}])
+
+    for aggregation in ("min", "median"):
+        row = compare_runs(payload, payload, aggregation=aggregation).rows[0]
+        assert row.baseline_ms == 10.0
+        assert row.baseline_metrics is not None
+        assert row.baseline_metrics.files_scanned == (2 if aggregation == "min" else 3)
+
+
 def test_compare_rows_include_contention_metrics_from_representative_sample() -> None:
     base = _run(
         [
@@ -2398,6 +2486,63 @@ def test_load_rejects_duplicate_case_ids(tmp_path: Path) -> None:
         _load(path)
 
 
+def test_load_drops_sample_metrics_unless_requested(tmp_path: Path) -> None:
+    payload = _run(
+        [
+            {
+                "case": "a",
+                "success": True,
+                "samples": [{"elapsed_ms": 5.0, "metrics": {"files_scanned": 3}}],
+            }
+        ]
+    )
+    path = tmp_path / "metrics.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    assert _load(path)["cases"][0]["samples"][0]["metrics"] == {"files_scanned": 3}
+    assert _load(path, include_metrics=False)["cases"][0]["samples"][0] == {
+        "elapsed_ms": 5.0
+    }
+
+
+def test_load_pair_returns_payloads_in_argument_order(tmp_path: Path) -> None:
+    from delta_bench_compare.compare import _load_pair
+
+    base_path = tmp_path / "base.json"
+    cand_path = tmp_path / "cand.json"
+    base_path.write_text(json.dumps(_run([{"case": "base"}])), encoding="utf-8")
+    cand_path.write_text(json.dumps(_run([{"case": "cand"}])), encoding="utf-8")
+
+    baseline, candidate = _load_pair(base_path, cand_path)
+    assert baseline["cases"][0]["case"] == "base"
+    assert candidate["cases"][0]["case"] == "cand"
+
+    cand_path.write_text("{", encoding="utf-8")
+    with pytest.raises(ValueError, match="invalid JSON"):
+        _load_pair(base_path, cand_path)
+
+
+def test_load_pair_parses_self_comparison_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from delta_bench_compare import compare
+
+    path = tmp_path / "run.json"
+    path.write_text(json.dumps(_run([{"case": "a"}])), encoding="utf-8")
+    loaded: list[Path] = []
+    real_load = compare._load
+
+    def counting_load(target: Path, *, include_metrics: bool = True) -> dict:
+        loaded.append(target)
+        return real_load(target, include_metrics=include_metrics)
+
+    monkeypatch.setattr(compare, "_load", counting_load)
+    baseline, candidate = compare._load_pair(path, tmp_path / "." / "run.json")
+
+    assert baseline is candidate
+    assert loaded == [path]
+
+
 def test_public_schema_loader_rejects_invalid_json(tmp_path: Path) -> None:
     from delta_bench_compare.schema import load_benchmark_payload
 
@@ -2408,6 +2553,85 @@ def test_public_schema_loader_rejects_invalid_json(tmp_path: Path) -> None:
         load_benchmark_payload(path)
 
 
+def test_public_schema_loader_falls_back_to_stdlib_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from delta_bench_compare import schema
+
+    payload = _run([{"case": "a", "success": True, "samples": [{"elapsed_ms": 1.5}]}])
+    path = tmp_path / "payload.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    accelerated = schema.load_benchmark_payload(path)
+
+    monkeypatch.setattr(schema, "orjson", None)
+    assert schema.load_benchmark_payload(path) == accelerated == payload
+
+    path.write_text("{", encoding="utf-8")
+    with pytest.raises(ValueError, match="invalid JSON"):
+        schema.load_benchmark_payload(path)
+
+
+def test_public_schema_loader_accepts_non_finite_tokens(tmp_path: Path) -> None:
+    from delta_bench_compare.schema import load_benchmark_payload
+
+    payload = _run([{"case": "a", "samples": [{"elapsed_ms": 1.5}]}])
+    payload["cases"][0]["samples"][0]["rows_per_sec"] = float("nan")
+    payload["cases"][0]["samples"][0]["bytes_per_sec"] = float("inf")
+    path = tmp_path / "non_finite.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    sample = load_benchmark_payload(path)["cases"][0]["samples"][0]
+
+    assert math.isnan(sample["rows_per_sec"])
+    assert sample["bytes_per_sec"] == float("inf")
+
+
+def test_public_schema_loader_interns_case_ids_and_classifications(
+    tmp_path: Path,
+) -> None:
+    from delta_bench_compare.schema import load_benchmark_payload
+
+    paths = []
+    for label in ("base", "cand"):
+        path = tmp_path / f"{label}.json"
+        path.write_text(json.dumps(_run([{"case": "scan_full"}])), encoding="utf-8")
+        paths.append(path)
+
+    baseline, candidate = (load_benchmark_payload(path) for path in paths)
+
+    assert baseline["cases"][0]["case"] is candidate["cases"][0]["case"]
+    assert (
+        baseline["cases"][0]["classification"]
+        is candidate["cases"][0]["classification"]
+    )
+
+
+def test_public_schema_loader_rejects_empty_file(tmp_path: Path) -> None:
+    from delta_bench_compare.schema import load_benchmark_payload
+
+    path = tmp_path / "empty.json"
+    path.write_bytes(b"")
+
+    with pytest.raises(ValueError, match="invalid JSON"):
+        load_benchmark_payload(path)
+
+
+def test_public_schema_loader_reads_pipes(tmp_path: Path) -> None:
+    from delta_bench_compare.schema import load_benchmark_payload
+
+    payload = _run([{"case": "a", "samples": [{"elapsed_ms": 1.5}]}])
+    read_fd, write_fd = os.pipe()
+    try:
+        os.write(write_fd, json.dumps(payload).encode("utf-8"))
+        os.close(write_fd)
+        write_fd = -1
+        assert load_benchmark_payload(Path(f"/dev/fd/{read_fd}")) == payload
+    finally:
+        os.close(read_fd)
+        if write_fd >= 0:
+            os.close(write_fd)
+
+
 def test_public_schema_loader_preserves_nested_contention_metrics(
     tmp_path: Path,
 ) -> None:
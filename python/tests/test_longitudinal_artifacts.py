@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -9,6 +12,8 @@ from delta_bench_longitudinal.artifacts import (
     artifact_metadata_path,
     build_artifact_from_checkout,
     build_revision_artifact,
+    build_revision_artifacts,
+    is_trusted_artifact_path,
     load_artifact_metadata,
     should_skip_build,
     write_artifact_metadata,
@@ -25,6 +30,15 @@ def test_artifact_paths_are_deterministic(tmp_path: Path) -> None:
     )
 
 
+def test_artifact_paths_sanitize_ascii_and_unicode_revisions(tmp_path: Path) -> None:
+    assert artifact_binary_path(tmp_path, "feature/x-y.1") == (
+        tmp_path / "feature_x_y_1" / "delta-bench-feature_x_y_1"
+    )
+    assert artifact_metadata_path(tmp_path, "/réf-ü/") == (
+        tmp_path / "réf_ü" / "metadata.json"
+    )
+
+
 def test_artifact_metadata_roundtrip(tmp_path: Path) -> None:
     metadata = ArtifactBuildMetadata(
         revision="deadbeef",
@@ -58,6 +72,52 @@ def test_should_skip_build_for_successful_metadata_and_binary(tmp_path: Path) ->
     assert should_skip_build(tmp_path, revision) is True
 
 
+def test_build_revision_artifact_reuses_trusted_artifact(tmp_path: Path) -> None:
+    checkout = tmp_path / "checkout"
+    checkout.mkdir()
+    artifacts_dir = tmp_path / "artifacts"
+    built = build_artifact_from_checkout(
+        checkout_dir=checkout,
+        revision="cafe02",
+        commit_timestamp="2026-01-01T00:00:00+00:00",
+        artifacts_dir=artifacts_dir,
+        build_command=[
+            "bash",
+            "-c",
+            "mkdir -p target/release && echo built > target/release/delta-bench",
+        ],
+        rust_toolchain="stable",
+    )
+
+    reused = build_revision_artifact(
+        repository=tmp_path / "missing-repo",
+        revision="cafe02",
+        commit_timestamp="2026-01-01T00:00:00+00:00",
+        artifacts_dir=artifacts_dir,
+    )
+
+    assert reused == built
+
+
+def test_load_artifact_metadata_sees_rewritten_file(tmp_path: Path) -> None:
+    metadata = ArtifactBuildMetadata(
+        revision="deadbeef",
+        commit_timestamp="2026-01-01T00:00:00+00:00",
+        build_timestamp="2026-02-01T00:00:00+00:00",
+        rust_toolchain="stable",
+        status="failure",
+        artifact_path=None,
+        error="boom",
+    )
+    path = artifact_metadata_path(tmp_path, metadata.revision)
+    write_artifact_metadata(path, metadata)
+    assert load_artifact_metadata(path) == metadata
+
+    rebuilt = replace(metadata, error="bang")
+    write_artifact_metadata(path, rebuilt)
+    assert load_artifact_metadata(path) == rebuilt
+
+
 def test_build_artifact_from_checkout_captures_failure(tmp_path: Path) -> None:
     checkout = tmp_path / "checkout"
     checkout.mkdir(parents=True, exist_ok=True)
@@ -75,6 +135,29 @@ def test_build_artifact_from_checkout_captures_failure(tmp_path: Path) -> None:
     assert "not found" in metadata.error
 
 
+def test_build_failure_reports_stderr_over_noisy_stdout(tmp_path: Path) -> None:
+    checkout = tmp_path / "checkout"
+    checkout.mkdir(parents=True, exist_ok=True)
+    script = (
+        "import sys\n"
+        "sys.stderr.write('error[E0425]: cannot find value\\n')\n"
+        "sys.stderr.flush()\n"
+        "sys.stdout.write('   Compiling crate\\n' * 5000)\n"
+        "sys.exit(101)\n"
+    )
+    metadata = build_artifact_from_checkout(
+        checkout_dir=checkout,
+        revision="badc0de",
+        commit_timestamp="2026-01-01T00:00:00+00:00",
+        artifacts_dir=tmp_path / "artifacts",
+        build_command=[sys.executable, "-c", script],
+        rust_toolchain="stable",
+    )
+
+    assert metadata.status == "failure"
+    assert metadata.error == "error[E0425]: cannot find value"
+
+
 def test_build_revision_artifact_persists_setup_failures(tmp_path: Path) -> None:
     artifacts_dir = tmp_path / "artifacts"
     metadata = build_revision_artifact(
@@ -113,3 +196,160 @@ def test_should_skip_build_rejects_untrusted_metadata_path(tmp_path: Path) -> No
     write_artifact_metadata(artifact_metadata_path(tmp_path, revision), metadata)
 
     assert should_skip_build(tmp_path, revision) is False
+
+
+def test_build_revision_artifacts_keeps_manifest_order_when_parallel(
+    tmp_path: Path,
+) -> None:
+    artifacts_dir = tmp_path / "artifacts"
+    revisions = [
+        ("aaa111", "2026-01-01T00:00:00+00:00"),
+        ("bbb222", "2026-01-02T00:00:00+00:00"),
+        ("ccc333", "2026-01-03T00:00:00+00:00"),
+    ]
+    results = build_revision_artifacts(
+        repository=tmp_path / "missing-repo",
+        revisions=revisions,
+        artifacts_dir=artifacts_dir,
+        max_workers=2,
+        sync_harness=False,
+    )
+
+    assert [meta.revision for meta in results] == [rev for rev, _ in revisions]
+    assert all(meta.status == "failure" for meta in results)
+    for revision, _ in revisions:
+        assert artifact_metadata_path(artifacts_dir, revision).exists()
+
+
+def test_build_revision_artifacts_waits_for_load_guard_before_each_build(
+    tmp_path: Path,
+) -> None:
+    events: list[str] = []
+    loads = iter([2.0, 0.5, 0.5])
+
+    def fake_build(**kwargs):  # type: ignore[no-untyped-def]
+        events.append(f"build:{kwargs['revision']}")
+        return ArtifactBuildMetadata(
+            revision=kwargs["revision"],
+            commit_timestamp=kwargs["commit_timestamp"],
+            build_timestamp="2026-02-01T00:00:00+00:00",
+            rust_toolchain="stable",
+            status="success",
+            artifact_path=None,
+            error=None,
+        )
+
+    results = build_revision_artifacts(
+        repository=tmp_path / "repo",
+        revisions=[
+            ("aaa111", "2026-01-01T00:00:00+00:00"),
+            ("bbb222", "2026-01-02T00:00:00+00:00"),
+        ],
+        artifacts_dir=tmp_path / "artifacts",
+        build_fn=fake_build,
+        max_load_per_cpu=1.0,
+        load_check_interval_seconds=0.25,
+        load_provider=lambda: next(loads),
+        sleep_fn=lambda seconds: events.append(f"sleep:{seconds}"),
+    )
+
+    assert [meta.revision for meta in results] == ["aaa111", "bbb222"]
+    assert events == ["sleep:0.25", "build:aaa111", "build:bbb222"]
+
+
+def test_is_trusted_artifact_path_rejects_symlinks_and_missing_files(
+    tmp_path: Path,
+) -> None:
+    revision = "abc123"
+    expected = artifact_binary_path(tmp_path, revision)
+    expected.parent.mkdir(parents=True, exist_ok=True)
+    link = tmp_path / "link-to-expected"
+    link.symlink_to(expected)
+
+    assert (
+        is_trusted_artifact_path(
+            artifacts_dir=tmp_path, revision=revision, artifact_path=expected
+        )
+        is False
+    )
+    expected.write_bytes(b"binary")
+    assert (
+        is_trusted_artifact_path(
+            artifacts_dir=tmp_path, revision=revision, artifact_path=expected
+        )
+        is True
+    )
+    assert (
+        is_trusted_artifact_path(
+            artifacts_dir=tmp_path, revision=revision, artifact_path=link
+        )
+        is False
+    )
+
+
+def test_build_revision_artifact_sparse_checkout_limits_worktree(
+    tmp_path: Path,
+) -> None:
+    repo = tmp_path / "repo"
+    for rel in ("crates/core/lib.rs", "docs/guide.md", "Cargo.toml"):
+        (repo / rel).parent.mkdir(parents=True, exist_ok=True)
+        (repo / rel).write_text(rel, encoding="utf-8")
+    for cmd in (
+        ["git", "init", "-b", "main"],
+        ["git", "add", "."],
+        [
+            "git",
+            "-c",
+            "user.name=tester",
+            "-c",
+            "user.email=tester@example.com",
+            "commit",
+            "-m",
+            "init",
+        ],
+    ):
+        subprocess.run(cmd, cwd=repo, check=True, capture_output=True)
+
+    metadata = build_revision_artifact(
+        repository=repo,
+        revision="HEAD",
+        commit_timestamp="2026-01-01T00:00:00+00:00",
+        artifacts_dir=tmp_path / "artifacts",
+        build_command=[
+            "bash",
+            "-c",
+            "test -f Cargo.toml && test -f crates/core/lib.rs && test ! -e docs"
+            " && mkdir -p target/release && touch target/release/delta-bench",
+        ],
+        sync_harness=False,
+        sparse_paths=["crates"],
+    )
+
+    assert metadata.status == "success", metadata.error
+
+
+def test_should_skip_build_rejects_binary_changed_after_build(tmp_path: Path) -> None:
+    checkout = tmp_path / "checkout"
+    checkout.mkdir()
+    artifacts_dir = tmp_path / "artifacts"
+    metadata = build_artifact_from_checkout(
+        checkout_dir=checkout,
+        revision="cafe01",
+        commit_timestamp="2026-01-01T00:00:00+00:00",
+        artifacts_dir=artifacts_dir,
+        build_command=[
+            "bash",
+            "-c",
+            "mkdir -p target/release && echo built > target/release/delta-bench",
+        ],
+        rust_toolchain="stable",
+    )
+
+    assert metadata.status == "success"
+    assert metadata.content_hash is not None
+    assert should_skip_build(artifacts_dir, "cafe01") is True
+
+    artifact_binary_path(artifacts_dir, "cafe01").write_text(
+        "tampered binary\n", encoding="utf-8"
+    )
+    assert should_skip_build(artifacts_dir, "cafe01") is False
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 import json
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable
 
+import pytest
 from delta_bench_longitudinal.artifacts import (
     artifact_binary_path,
     artifact_metadata_path,
 )
-from delta_bench_longitudinal.cli import orchestrate_from_manifest
+from delta_bench_longitudinal.cli import (
+    _ingest_from_state,
+    main,
+    orchestrate_from_manifest,
+)
 from delta_bench_longitudinal.matrix_runner import matrix_result_label
 from delta_bench_longitudinal.revisions import (
     RevisionEntry,
@@ -363,3 +369,109 @@ def test_orchestrate_rejects_untrusted_artifact_paths(tmp_path: Path) -> None:
     assert summary["built"] == 0
     assert summary["ingested_rows"] == 0
     assert calls["count"] == 0
+
+
+def test_orchestrate_builds_revisions_in_parallel(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    revisions = [f"rev-par-{i}" for i in range(3)]
+    manifest = RevisionManifest(
+        schema_version=1,
+        generated_at=datetime(2026, 2, 1, 0, 0, tzinfo=timezone.utc),
+        repository=str(tmp_path),
+        strategy="release-tags",
+        revisions=[
+            RevisionEntry(
+                commit=commit,
+                commit_timestamp=f"2026-01-0{i + 1}T00:00:00+00:00",
+                source="release-tags",
+                tag=f"v0.{i}.0",
+            )
+            for i, commit in enumerate(revisions)
+        ],
+    )
+    write_manifest(manifest, manifest_path)
+
+    artifacts_dir = tmp_path / "artifacts"
+    results_dir = tmp_path / "results"
+    reports_dir = tmp_path / "reports"
+    barrier = threading.Barrier(2, timeout=5)
+    build = _make_fake_build(artifacts_dir)
+
+    def overlapping_build(**kwargs):  # type: ignore[no-untyped-def]
+        if kwargs["revision"] != revisions[-1]:
+            barrier.wait()
+        return build(**kwargs)
+
+    summary = orchestrate_from_manifest(
+        manifest_path=manifest_path,
+        artifacts_dir=artifacts_dir,
+        results_dir=results_dir,
+        state_path=tmp_path / "matrix_state.json",
+        store_dir=tmp_path / "store",
+        markdown_path=reports_dir / "summary.md",
+        html_path=reports_dir / "report.html",
+        suites=["read_scan"],
+        scales=["sf1"],
+        timeout_seconds=5,
+        max_retries=0,
+        max_parallel=1,
+        max_load_per_cpu=None,
+        load_check_interval_seconds=0.01,
+        baseline_window=2,
+        regression_threshold=0.05,
+        significance_method="none",
+        significance_alpha=0.05,
+        build_fn=overlapping_build,
+        matrix_executor=_make_fake_executor(results_dir),
+        max_parallel_builds=2,
+    )
+
+    assert summary["built"] == 3
+    assert summary["ingested_rows"] == 3
+
+
+def test_ingest_treats_non_directory_results_path_as_empty(tmp_path: Path) -> None:
+    results_dir = tmp_path / "results"
+    results_dir.write_text("not a directory\n", encoding="utf-8")
+    matrix_state = {
+        "config": {"lane": "macro"},
+        "cases": {
+            "rev-1|sf1|read_scan": {
+                "revision": "rev-1",
+                "suite": "read_scan",
+                "scale": "sf1",
+                "status": "success",
+            }
+        },
+    }
+
+    ingested = _ingest_from_state(
+        matrix_state=matrix_state,
+        results_dir=results_dir,
+        store_dir=tmp_path / "store",
+        label_prefix="longitudinal",
+        revision_to_ts={"rev-1": "2026-01-01T00:00:00+00:00"},
+    )
+
+    assert ingested == 0
+
+
+def test_cli_rejects_non_positive_max_parallel_builds(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    argv = [
+        "build-artifacts",
+        "--manifest",
+        str(manifest_path),
+        "--artifacts-dir",
+        str(tmp_path / "artifacts"),
+        "--max-parallel-builds",
+        "0",
+    ]
+
+    with pytest.raises(SystemExit) as excinfo:
+        main(argv)
+
+    assert excinfo.value.code == 2
+    assert "--max-parallel-builds: must be >= 1" in capsys.readouterr().err
@@ -9,6 +9,7 @@ from pathlib import Path
 
 import pytest
 
+from delta_bench_longitudinal import matrix_runner
 from delta_bench_longitudinal.matrix_runner import (
     MatrixArtifact,
     MatrixRunConfig,
@@ -230,6 +231,137 @@ def test_state_roundtrip(tmp_path: Path) -> None:
     assert load_matrix_state(state_path) == data
 
 
+def test_load_matrix_state_replays_journal_over_snapshot(tmp_path: Path) -> None:
+    state_path = tmp_path / "matrix_state.json"
+    save_matrix_state(
+        state_path,
+        {"schema_version": 1, "cases": {"a|s|sf1": {"status": "failure"}}},
+    )
+    journal = state_path.with_name(state_path.name + ".journal")
+    journal.write_text(
+        json.dumps({"key": "a|s|sf1", "case": {"status": "success"}})
+        + "\n"
+        + json.dumps({"key": "b|s|sf1", "case": {"status": "failure"}})
+        + "\n"
+        + '{"key": "c|s|sf1", "ca',
+        encoding="utf-8",
+    )
+
+    assert load_matrix_state(state_path)["cases"] == {
+        "a|s|sf1": {"status": "success"},
+        "b|s|sf1": {"status": "failure"},
+    }
+
+
+def test_journal_replay_stops_at_torn_utf8_without_orjson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(matrix_runner, "orjson", None)
+    state_path = tmp_path / "matrix_state.json"
+    save_matrix_state(state_path, {"schema_version": 1, "cases": {}})
+    journal = state_path.with_name(state_path.name + ".journal")
+    complete = json.dumps(
+        {"key": "a|s|sf1", "case": {"status": "success"}}, ensure_ascii=False
+    )
+    torn = json.dumps(
+        {"key": "b|s|sf1", "case": {"failure_reason": "caf\u00e9"}},
+        ensure_ascii=False,
+    ).encode("utf-8")
+    journal.write_bytes(
+        complete.encode("utf-8") + b"\n" + torn[: torn.index(b"\xc3") + 1]
+    )
+
+    assert load_matrix_state(state_path)["cases"] == {
+        "a|s|sf1": {"status": "success"}
+    }
+
+
+def test_run_matrix_failed_final_snapshot_keeps_original_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    state_path = tmp_path / "matrix_state.json"
+    real_save = matrix_runner.save_matrix_state
+    calls = []
+
+    def flaky_save(path: Path, state: dict) -> None:
+        calls.append(path)
+        if len(calls) > 1:
+            raise OSError("disk full")
+        real_save(path, state)
+
+    def failing_load() -> float:
+        raise RuntimeError("load probe failed")
+
+    monkeypatch.setattr(matrix_runner, "save_matrix_state", flaky_save)
+    config = MatrixRunConfig(
+        suites=["read_scan"],
+        scales=["sf1"],
+        timeout_seconds=1,
+        max_retries=0,
+        state_path=state_path,
+        max_load_per_cpu=1.0,
+    )
+
+    with pytest.raises(RuntimeError, match="load probe failed"):
+        run_matrix(
+            artifacts=[
+                MatrixArtifact(revision="rev1", commit_timestamp="t", artifact_path="/x")
+            ],
+            config=config,
+            executor=lambda *_args: (0, ""),
+            load_provider=failing_load,
+        )
+    assert len(calls) == 2
+
+
+def test_run_matrix_compacts_journal_into_state_file(tmp_path: Path) -> None:
+    state_path = tmp_path / "matrix_state.json"
+    config = MatrixRunConfig(
+        suites=["read_scan", "write"],
+        scales=["sf1"],
+        timeout_seconds=1,
+        max_retries=0,
+        state_path=state_path,
+    )
+    artifacts = [
+        MatrixArtifact(revision=f"rev{i}", commit_timestamp="t", artifact_path="/x")
+        for i in range(10)
+    ]
+
+    state = run_matrix(
+        artifacts=artifacts, config=config, executor=lambda *_args: (0, "")
+    )
+
+    assert len(state["cases"]) == 20
+    assert not state_path.with_name(state_path.name + ".journal").exists()
+    assert json.loads(state_path.read_text(encoding="utf-8")) == state
+
+
+def test_state_roundtrip_without_orjson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(matrix_runner, "orjson", None)
+    state_path = tmp_path / "matrix_state.json"
+    config = MatrixRunConfig(
+        suites=["read_scan"],
+        scales=["sf1"],
+        timeout_seconds=1,
+        max_retries=0,
+        state_path=state_path,
+    )
+
+    state = run_matrix(
+        artifacts=[
+            MatrixArtifact(revision="revS", commit_timestamp="t", artifact_path="/x")
+        ],
+        config=config,
+        executor=lambda *_args: (0, ""),
+    )
+
+    assert state_path.read_text(encoding="utf-8").endswith("}\n")
+    assert load_matrix_state(state_path) == state
+
+
 def test_load_matrix_state_wraps_invalid_json(tmp_path: Path) -> None:
     state_path = tmp_path / "matrix_state.json"
     state_path.write_text("{not valid json\n", encoding="utf-8")
@@ -528,3 +660,72 @@ def test_matrix_result_label_scopes_results_by_lane() -> None:
     assert matrix_result_label("nightly/bench", "revA", "sf1") == (
         "nightly_bench-revA-sf1"
     )
+
+
+def test_default_executor_reports_tail_of_failing_output(tmp_path: Path) -> None:
+    binary = tmp_path / "delta-bench"
+    binary.write_text(
+        "#!/usr/bin/env bash\n"
+        "for i in $(seq 1 5000); do echo \"noise $i\" >&2; done\n"
+        "echo 'final error' >&2\n"
+        "exit 3\n",
+        encoding="utf-8",
+    )
+    binary.chmod(0o755)
+    config = MatrixRunConfig(
+        suites=["read_scan"],
+        scales=["sf1"],
+        timeout_seconds=30,
+        max_retries=0,
+        state_path=tmp_path / "matrix_state.json",
+        results_dir=tmp_path / "results",
+    )
+
+    state = run_matrix(
+        artifacts=[
+            MatrixArtifact(
+                revision="revF", commit_timestamp="t", artifact_path=str(binary)
+            )
+        ],
+        config=config,
+    )
+
+    case = state["cases"]["revF|read_scan|sf1"]
+    assert case["status"] == "failure"
+    assert case["failure_reason"].endswith("final error")
+    assert len(case["failure_reason"]) <= 4096
+
+
+def test_load_guard_is_checked_once_per_dispatch_round(tmp_path: Path) -> None:
+    load_checks: list[int] = []
+
+    def fake_load() -> float:
+        load_checks.append(1)
+        return 0.1
+
+    config = MatrixRunConfig(
+        suites=["read_scan"],
+        scales=["sf1"],
+        timeout_seconds=1,
+        max_retries=0,
+        state_path=tmp_path / "matrix_state.json",
+        max_parallel=4,
+        max_load_per_cpu=1.0,
+        load_check_interval_seconds=0.01,
+    )
+    barrier = threading.Barrier(4, timeout=5)
+
+    def gated_executor(*_args):  # type: ignore[no-untyped-def]
+        barrier.wait()
+        return 0, ""
+
+    run_matrix(
+        artifacts=[
+            MatrixArtifact(revision=f"rev{i}", commit_timestamp="t", artifact_path="/x")
+            for i in range(4)
+        ],
+        config=config,
+        executor=gated_executor,
+        load_provider=fake_load,
+    )
+    assert len(load_checks) == 1
@@ -4,7 +4,12 @@ from contextlib import closing
 import json
 from pathlib import Path
 
-from delta_bench_longitudinal.reporting import generate_trend_reports
+import pytest
+
+from delta_bench_longitudinal.reporting import (
+    _mann_whitney_one_sided_p_value,
+    generate_trend_reports,
+)
 from delta_bench_longitudinal.store import (
     _connect_store,
     ingest_benchmark_result,
@@ -542,3 +547,38 @@ def test_generate_trend_reports_excludes_zero_sample_legacy_rows(
 
     assert summary["total_series"] == 0
     assert summary["regressions"] == 0
+
+
+def test_mann_whitney_averages_tied_ranks() -> None:
+    p_value = _mann_whitney_one_sided_p_value(
+        baseline_samples=[1.0, 2.0, 3.0, 3.0],
+        latest_samples=[3.0, 3.0, 4.0],
+    )
+
+    assert p_value == pytest.approx(0.05933517278229161)
+    assert (
+        _mann_whitney_one_sided_p_value(
+            baseline_samples=[5.0, 5.0], latest_samples=[5.0, 5.0]
+        )
+        is None
+    )
+
+
+def test_mann_whitney_without_ties_uses_plain_variance() -> None:
+    p_value = _mann_whitney_one_sided_p_value(
+        baseline_samples=[1.0, 2.0, 3.0],
+        latest_samples=[4.0, 5.0, 6.0],
+    )
+
+    # U = 9, mean 4.5, variance n1 * n2 * (n1 + n2 + 1) / 12 = 5.25
+    assert p_value == pytest.approx(0.024767306717813353)
+
+
+def test_mann_whitney_keeps_precision_in_the_far_tail() -> None:
+    p_value = _mann_whitney_one_sided_p_value(
+        baseline_samples=[float(value) for value in range(200)],
+        latest_samples=[1000.0 + value for value in range(50)],
+    )
+
+    assert p_value is not None
+    assert 0.0 < p_value < 1e-20
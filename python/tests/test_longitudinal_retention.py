@@ -145,6 +145,27 @@ def test_prune_artifacts_apply_enforces_count_limit(tmp_path: Path) -> None:
     assert not (artifacts / "rev-2").exists()
 
 
+def test_prune_artifacts_counts_symlinked_artifact_dirs(tmp_path: Path) -> None:
+    artifacts = tmp_path / "artifacts"
+    _write_artifact_metadata(artifacts, "rev-new", "2026-02-20T00:00:00+00:00")
+    _write_artifact_metadata(
+        tmp_path / "elsewhere", "rev-old", "2025-12-01T00:00:00+00:00"
+    )
+    (artifacts / "rev-old").symlink_to(tmp_path / "elsewhere" / "rev-old")
+    (artifacts / "stray-file").write_text("ignored\n", encoding="utf-8")
+
+    summary = prune_artifacts(
+        artifacts_dir=artifacts,
+        max_age_days=30,
+        max_artifacts=None,
+        apply=False,
+        now=datetime(2026, 3, 1, 0, 0, tzinfo=timezone.utc),
+    )
+
+    assert summary["total"] == 2
+    assert summary["candidates"] == ["rev-old"]
+
+
 def test_prune_store_dry_run(tmp_path: Path) -> None:
     store_dir = tmp_path / "store"
     _seed_store_runs(store_dir)
@@ -171,6 +192,7 @@ def test_prune_store_apply_deletes_runs_without_rows_rewrite(tmp_path: Path) ->
         now=datetime(2026, 3, 2, 0, 0, tzinfo=timezone.utc),
     )
     assert summary["removed_runs"] == 1
+    assert summary["remaining_runs"] == 2
     rows = load_longitudinal_rows(store_dir)
     assert {row["run_id"] for row in rows} == {"run-2", "run-3"}
     with closing(_connect_store(store_dir)) as conn:
@@ -183,6 +205,22 @@ def test_prune_store_apply_deletes_runs_without_rows_rewrite(tmp_path: Path) ->
     assert not (store_dir / "index.json").exists()
 
 
+def test_prune_store_apply_without_candidates_is_a_no_op(tmp_path: Path) -> None:
+    store_dir = tmp_path / "store"
+    _seed_store_runs(store_dir)
+    summary = prune_store(
+        store_dir=store_dir,
+        max_age_days=None,
+        max_runs=5,
+        apply=True,
+        now=datetime(2026, 3, 2, 0, 0, tzinfo=timezone.utc),
+    )
+    assert summary["candidate_runs"] == []
+    assert summary["removed_runs"] == 0
+    assert summary["remaining_runs"] == 3
+    assert len(load_longitudinal_rows(store_dir)) == 3
+
+
 def test_prune_store_rejects_legacy_jsonl_store_until_migrated(tmp_path: Path) -> None:
     store_dir = tmp_path / "store"
     store_dir.mkdir(parents=True, exist_ok=True)
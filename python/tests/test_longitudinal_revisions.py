@@ -70,6 +70,22 @@ def test_select_release_tags(tmp_path: Path) -> None:
     assert manifest.strategy == "release-tags"
 
 
+def test_select_release_tags_peels_annotated_and_nested_tags(tmp_path: Path) -> None:
+    _init_repo(tmp_path)
+    c1 = _commit(tmp_path, "c1", "2026-01-01T10:00:00+05:30")
+    _run(["git", "tag", "-a", "v0.1.0", "-m", "release"], cwd=tmp_path)
+    _run(["git", "tag", "-a", "v0.1.1", "-m", "nested", "v0.1.0"], cwd=tmp_path)
+    _run(["git", "tag", "not-a-release"], cwd=tmp_path)
+
+    manifest = select_revisions(tmp_path, strategy="release-tags")
+
+    assert [entry.tag for entry in manifest.revisions] == ["v0.1.0", "v0.1.1"]
+    assert [entry.commit for entry in manifest.revisions] == [c1, c1]
+    assert {entry.commit_timestamp for entry in manifest.revisions} == {
+        "2026-01-01T10:00:00+05:30"
+    }
+
+
 def test_select_date_window(tmp_path: Path) -> None:
     _init_repo(tmp_path)
     c1 = _commit(tmp_path, "c1", "2026-01-01T09:00:00+00:00")
@@ -205,3 +221,12 @@ def test_invalid_strategy_and_dates(tmp_path: Path) -> None:
             start_date="2026-01-01",
             end_date="not-a-date",
         )
+
+    with pytest.raises(ValueError, match="git command failed: git log"):
+        select_revisions(
+            tmp_path,
+            strategy="date-window",
+            start_date="2026-01-01",
+            end_date="2026-01-31",
+            ref="no-such-ref",
+        )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import math
 import os
 import sqlite3
 from pathlib import Path
@@ -8,7 +9,11 @@ from pathlib import Path
 import pytest
 
 from delta_bench_longitudinal.store import (
+    _dump_sample_values,
+    _load_sample_values,
     ingest_benchmark_result,
+    ingest_benchmark_results,
+    iter_longitudinal_rows,
     load_longitudinal_rows,
     store_db_path,
 )
@@ -275,6 +280,28 @@ def test_ingest_is_append_safe_and_idempotent(tmp_path: Path) -> None:
     assert len(load_longitudinal_rows(store_dir)) == 2
 
 
+def test_iter_rows_streams_the_same_rows_as_load(tmp_path: Path) -> None:
+    result_path = tmp_path / "result.json"
+    result_path.write_text(json.dumps(_result_payload_v5()), encoding="utf-8")
+    store_dir = tmp_path / "store"
+
+    assert list(iter_longitudinal_rows(store_dir)) == []
+    ingest_benchmark_result(
+        store_dir=store_dir,
+        result_path=result_path,
+        revision="rev1",
+        commit_timestamp="2026-01-01T00:00:00+00:00",
+    )
+
+    rows = iter_longitudinal_rows(store_dir)
+    assert next(rows)["case"] == "scan_all"
+    assert [row["case"] for row in rows] == ["scan_predicate"]
+    assert [row["case"] for row in load_longitudinal_rows(store_dir)] == [
+        "scan_all",
+        "scan_predicate",
+    ]
+
+
 def test_rows_include_reproducibility_metadata(tmp_path: Path) -> None:
     result_path = tmp_path / "result.json"
     result_path.write_text(json.dumps(_result_payload_v5()), encoding="utf-8")
@@ -334,6 +361,57 @@ def test_ingest_dedupes_identical_payload_from_different_paths(tmp_path: Path) -
     assert len(load_longitudinal_rows(store_dir)) == 2
 
 
+def test_batch_ingest_appends_runs_and_dedupes_within_batch(tmp_path: Path) -> None:
+    rev1_path = tmp_path / "rev1.json"
+    rev2_path = tmp_path / "rev2.json"
+    rev1_path.write_text(json.dumps(_result_payload_v5()), encoding="utf-8")
+    rev2_payload = _result_payload_v5()
+    rev2_payload["context"]["run_id"] = "run-v5-rev2"
+    rev2_payload["context"]["git_sha"] = "rev2"
+    rev2_payload["context"]["created_at"] = "2026-02-02T00:00:00+00:00"
+    rev2_path.write_text(json.dumps(rev2_payload), encoding="utf-8")
+    store_dir = tmp_path / "store"
+
+    outcome = ingest_benchmark_results(
+        store_dir=store_dir,
+        entries=[
+            (rev1_path, "rev1", "2026-01-01T00:00:00+00:00"),
+            (rev2_path, "rev2", "2026-01-02T00:00:00+00:00"),
+            (rev1_path, "rev1", "2026-01-01T00:00:00+00:00"),
+        ],
+    )
+    again = ingest_benchmark_results(
+        store_dir=store_dir,
+        entries=[(rev2_path, "rev2", "2026-01-02T00:00:00+00:00")],
+    )
+
+    assert outcome == {"runs_appended": 2, "rows_appended": 4, "deduped": 1}
+    assert again == {"runs_appended": 0, "rows_appended": 0, "deduped": 1}
+    rows = load_longitudinal_rows(store_dir)
+    assert [row["revision"] for row in rows] == ["rev1", "rev1", "rev2", "rev2"]
+
+
+def test_batch_ingest_validates_every_payload_before_writing(tmp_path: Path) -> None:
+    good_path = tmp_path / "good.json"
+    bad_path = tmp_path / "bad.json"
+    good_path.write_text(json.dumps(_result_payload_v5()), encoding="utf-8")
+    bad_payload = _result_payload_v5()
+    del bad_payload["cases"][0]["compatibility_key"]
+    bad_path.write_text(json.dumps(bad_payload), encoding="utf-8")
+    store_dir = tmp_path / "store"
+
+    with pytest.raises(ValueError, match="compatibility_key"):
+        ingest_benchmark_results(
+            store_dir=store_dir,
+            entries=[
+                (good_path, "rev1", "2026-01-01T00:00:00+00:00"),
+                (bad_path, "rev2", "2026-01-02T00:00:00+00:00"),
+            ],
+        )
+
+    assert load_longitudinal_rows(store_dir) == []
+
+
 def test_ingest_rejects_legacy_jsonl_store_until_migrated(tmp_path: Path) -> None:
     result_path = tmp_path / "result.json"
     result_path.write_text(json.dumps(_result_payload_v5()), encoding="utf-8")
@@ -573,3 +651,16 @@ def test_ingest_v5_result_migrates_existing_legacy_sqlite_store(tmp_path: Path)
     assert outcome["rows_appended"] == 2
     rows = load_longitudinal_rows(store_dir)
     assert any(row["case"] == "scan_all" for row in rows)
+
+
+def test_sample_values_decode_stdlib_only_tokens() -> None:
+    assert _load_sample_values("[100.0, 120.0]") == [100.0, 120.0]
+    decoded = _load_sample_values("[NaN, 90.0]")
+    assert math.isnan(decoded[0])
+    assert decoded[1] == 90.0
+
+
+def test_sample_values_encode_round_trips_non_finite_values() -> None:
+    assert _load_sample_values(_dump_sample_values([100.0, 120.5])) == [100.0, 120.5]
+    decoded = _load_sample_values(_dump_sample_values([float("inf"), 1.0]))
+    assert decoded == [float("inf"), 1.0]